@@ -1,12 +1,124 @@
-from PIL import Image, ImageDraw, ImageFont
+import PIL
+from PIL import Image, ImageDraw, ImageFont, features
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import io
+import json
 import os
 
+WHITE = (255, 255, 255)
+
+@lru_cache(maxsize=None)
+def _get_fonts():
+    """Load the large, medium and small fonts once per process"""
+    # Try to use a default font, fallback to basic if not available
+    try:
+        return (
+            ImageFont.truetype("arial.ttf", 48),
+            ImageFont.truetype("arial.ttf", 24),
+            ImageFont.truetype("arial.ttf", 18)
+        )
+    except:
+        default_font = ImageFont.load_default()
+        return default_font, default_font, default_font
+
+@lru_cache(maxsize=None)
+def _get_border_mask():
+    """Rasterize the decorative border once as a mask shared by every image"""
+    mask = Image.new('L', (800, 600), 0)
+    ImageDraw.Draw(mask).rectangle([50, 50, 750, 550], outline=255, width=3)
+    return mask
+
+@lru_cache(maxsize=32)
+def _fill_with_border(color):
+    """Produce the solid fill and white border in a single lookup pass per band.
+    
+    Cached per colour; callers must not draw on the result directly.
+    """
+    mask = _get_border_mask()
+    # Unmasked pixels map to the fill channel, border pixels map to white
+    return Image.merge('RGB', [mask.point([channel] + [255] * 255) for channel in color])
+
+# Paths are anchored to this script so it behaves the same from any working directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DIR = os.path.join(SCRIPT_DIR, 'sample_images')
+# Kept beside the script rather than in sample_images, which is bundled into the app
+CACHE_MANIFEST = os.path.join(SCRIPT_DIR, '.sample_cache.json')
+# Bump whenever _render_one changes its output so cached images are re-rendered
+RENDER_VERSION = 1
+# One image renders in about 10 ms, while starting worker processes (re-importing Pillow
+# in each under spawn on Windows and macOS) costs around 300 ms, so only large batches
+# are worth spreading across processes
+PARALLEL_RENDER_MIN_IMAGES = 64
+
+def _image_digest(img_data):
+    """Content hash of the inputs that determine a sample image's pixels"""
+    key = repr((RENDER_VERSION, sorted(img_data.items()))).encode('utf-8')
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+def _load_cache_manifest():
+    try:
+        with open(CACHE_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+@lru_cache(maxsize=None)
+def _get_canvas():
+    """Single 800x600 RGB buffer reused for every image rendered in this process"""
+    return Image.new('RGB', (800, 600))
+
+def _text_width(draw, text, font):
+    """Horizontal advance of text, used to centre it"""
+    # Centering only needs the advance width, so skip the full glyph bounding box.
+    # The default bitmap font only gained getlength in Pillow 9.2.
+    if hasattr(font, 'getlength'):
+        return int(font.getlength(text))
+    left, _, right, _ = draw.textbbox((0, 0), text, font=font)
+    return right - left
+
+def _render_one(img_data):
+    """Render a single sample image, returning its path and encoded JPEG bytes"""
+    # Create a 800x600 image with the decorative border already in place
+    # Reuses one buffer per process; safe because encoding below is synchronous
+    img = _get_canvas()
+    img.paste(_fill_with_border(img_data['color']))
+    draw = ImageDraw.Draw(img)
+    
+    font_large, font_medium, font_small = _get_fonts()
+    
+    # Title, description and filename, centred horizontally in one pass
+    layout = (
+        (200, img_data['title'], font_large),
+        (280, img_data['description'], font_medium),
+        (350, f"File: {img_data['filename']}", font_small),
+    )
+    for y, text, font in layout:
+        x = (800 - _text_width(draw, text, font)) // 2
+        draw.text((x, y), text, fill=WHITE, font=font)
+    
+    # Encode in memory; the caller writes every file in one batch.
+    # Stay on JPEG because ReportLab embeds JPEG streams without re-encoding,
+    # but flat colour fields do not need quality=95 to look clean.
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=75, optimize=True, progressive=False)
+    filepath = os.path.join(SAMPLE_DIR, img_data['filename'])
+    return filepath, buffer.getvalue()
+
 def create_sample_images():
     """Create sample property images for testing"""
     
+    # Pillow-SIMD tags its releases with a ".postN" suffix
+    if 'post' in PIL.__version__:
+        print(f"Using Pillow-SIMD {PIL.__version__}")
+    # JPEG encoding dominates the runtime; Pillow already drives libjpeg-turbo's
+    # SIMD encoder directly when it was built against it
+    if not features.check_feature('libjpeg_turbo'):
+        print("Note: Pillow was built without libjpeg-turbo; JPEG encoding will be slower")
+    
     # Create sample_images directory if it doesn't exist
-    if not os.path.exists('sample_images'):
-        os.makedirs('sample_images')
+    os.makedirs(SAMPLE_DIR, exist_ok=True)
     
     # Sample image data
     images = [
@@ -48,49 +160,46 @@ def create_sample_images():
         }
     ]
     
+    # Outputs are deterministic, so only re-render images whose inputs changed
+    manifest = _load_cache_manifest()
+    pending = []
     for img_data in images:
-        # Create a 800x600 image
-        img = Image.new('RGB', (800, 600), img_data['color'])
-        draw = ImageDraw.Draw(img)
-        
-        # Try to use a default font, fallback to basic if not available
-        try:
-            font_large = ImageFont.truetype("arial.ttf", 48)
-            font_medium = ImageFont.truetype("arial.ttf", 24)
-            font_small = ImageFont.truetype("arial.ttf", 18)
-        except:
-            font_large = ImageFont.load_default()
-            font_medium = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-        
-        # Add title
-        title_bbox = draw.textbbox((0, 0), img_data['title'], font=font_large)
-        title_width = title_bbox[2] - title_bbox[0]
-        title_x = (800 - title_width) // 2
-        draw.text((title_x, 200), img_data['title'], fill='white', font=font_large)
-        
-        # Add description
-        desc_bbox = draw.textbbox((0, 0), img_data['description'], font=font_medium)
-        desc_width = desc_bbox[2] - desc_bbox[0]
-        desc_x = (800 - desc_width) // 2
-        draw.text((desc_x, 280), img_data['description'], fill='white', font=font_medium)
-        
-        # Add filename
-        filename_text = f"File: {img_data['filename']}"
-        filename_bbox = draw.textbbox((0, 0), filename_text, font=font_small)
-        filename_width = filename_bbox[2] - filename_bbox[0]
-        filename_x = (800 - filename_width) // 2
-        draw.text((filename_x, 350), filename_text, fill='white', font=font_small)
-        
-        # Add a decorative border
-        draw.rectangle([50, 50, 750, 550], outline='white', width=3)
-        
-        # Save the image
-        filepath = os.path.join('sample_images', img_data['filename'])
-        img.save(filepath, 'JPEG', quality=95)
+        filepath = os.path.join(SAMPLE_DIR, img_data['filename'])
+        up_to_date = (
+            manifest.get(img_data['filename']) == _image_digest(img_data)
+            and os.path.exists(filepath)
+            and os.path.getsize(filepath) > 0
+        )
+        if up_to_date:
+            print(f"Cached: {filepath}")
+        else:
+            pending.append(img_data)
+    
+    # Each image is independent and CPU-bound, so big batches render on separate cores
+    rendered = []
+    if pending:
+        # Warm the font cache so a serial run (or forked workers) parse the TTF only once
+        _get_fonts()
+        workers = min(len(pending), os.cpu_count() or 1)
+        if workers > 1 and len(pending) >= PARALLEL_RENDER_MIN_IMAGES:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                rendered = list(executor.map(_render_one, pending))
+        else:
+            rendered = [_render_one(img_data) for img_data in pending]
+    
+    # Save the images
+    for filepath, jpeg_bytes in rendered:
+        with open(filepath, 'wb') as f:
+            f.write(jpeg_bytes)
         print(f"Created: {filepath}")
     
-    print(f"\n✅ Created {len(images)} sample images in 'sample_images' folder")
+    for img_data in pending:
+        manifest[img_data['filename']] = _image_digest(img_data)
+    if pending:
+        with open(CACHE_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    
+    print(f"\n✅ Created {len(rendered)} sample images ({len(images) - len(rendered)} cached) in 'sample_images' folder")
     print("You can now run the app and it will automatically load these images!")
 
 if __name__ == "__main__":
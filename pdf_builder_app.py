@@ -4,34 +4,21 @@ from PIL import Image, ImageTk
 import os
 import sys
 import math
-import datetime
+import gc
+import hashlib
+import io
+import queue
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 try:
     import requests  # type: ignore[import]
 except ImportError:  # pragma: no cover - optional dependency handled at runtime
     requests = None
-from reportlab.lib.pagesizes import A4, letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+# ReportLab is imported where a PDF is actually built, keeping app startup fast
 from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.graphics.shapes import Drawing, Rect, String
-from reportlab.graphics import renderPDF
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.textlabels import Label
-from reportlab.lib.colors import HexColor
-from reportlab.platypus import KeepTogether, Frame
-from reportlab.platypus.flowables import Flowable
-from reportlab.lib.utils import ImageReader
-
-def format_date_with_ordinal(date_obj):
-    """Format date with ordinal suffix (1st, 2nd, 3rd, 4th, etc.)"""
-    day = date_obj.day
-    if 10 <= day % 100 <= 20:
-        suffix = 'th'
-    else:
-        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-    return date_obj.strftime(f"{day}{suffix} %B %Y")
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -42,230 +29,230 @@ def get_resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-def create_placeholder_drawing(width, height):
-    """Create a gray placeholder Drawing for use in PDF"""
-    placeholder = Drawing(width, height)
-    placeholder.add(Rect(0, 0, width, height, fillColor=HexColor('#CCCCCC'), strokeColor=HexColor('#CCCCCC')))
-    return placeholder
+@lru_cache(maxsize=256)
+def _hash_file_contents(path, mtime, size):
+    """SHA-256 of a file's bytes, memoized on (path, mtime, size)"""
+    # SHA-256 runs on the CPU's SHA extensions through OpenSSL, which is
+    # faster than BLAKE2b for multi-megabyte photos on current hardware
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-class CoverPageFlowable(Flowable):
-    """Custom flowable for cover page with absolute positioning"""
-    def __init__(self, data, images_by_section, accent_gold, primary_blue, logo_path=None):
-        Flowable.__init__(self)
-        self.data = data
-        self.images_by_section = images_by_section
-        self.accent_gold = accent_gold
-        self.primary_blue = primary_blue
-        self.logo_path = logo_path
-        
-        # Calculate margins to match document margins exactly
-        # Use same calculation as in generate_pdf for consistency
-        left_margin = 0.75*inch
-        right_margin = 0.75*inch
-        bottom_margin = 0.75*inch
-        HEADER_TOP_OFFSET = 0.45 * inch
-        
-        # Calculate header height using same logic as generate_pdf
-        TAGLINE_SPACING_POINTS = 12
-        TAGLINE_FONT_SIZE = 9
-        TAGLINE_TEXT_MARGIN = 2
-        TAGLINE_TOTAL_HEIGHT = (TAGLINE_SPACING_POINTS + TAGLINE_FONT_SIZE + TAGLINE_TEXT_MARGIN) / 72.0 * inch
-        
-        # Get actual logo height (same calculation as generate_pdf)
-        logo_width = 1.4 * inch
-        LOGO_ACTUAL_HEIGHT = 0.6*inch  # Default fallback
-        if self.logo_path and os.path.exists(self.logo_path):
-            try:
-                from reportlab.lib.utils import ImageReader
-                logo_reader = ImageReader(self.logo_path)
-                img_width, img_height = logo_reader.getSize()
-                if img_width and img_height:
-                    LOGO_ACTUAL_HEIGHT = logo_width * (img_height / img_width)
-            except Exception:
-                pass
-        
-        HEADER_TO_CONTENT_SPACING = 0  # No spacing - content starts immediately
-        top_margin = HEADER_TOP_OFFSET + LOGO_ACTUAL_HEIGHT + TAGLINE_TOTAL_HEIGHT + HEADER_TO_CONTENT_SPACING
-        
-        # Flowable dimensions match the actual frame size
-        # Subtract a safety margin to ensure it fits within the frame
-        # (reportlab frames may have slight internal padding or rounding differences)
-        # 12 points = 0.167 inches, use slightly more for safety
-        safety_margin = 0.2 * inch  # Safety margin to ensure fit (covers ~14.4 points)
-        self.width = A4[0] - left_margin - right_margin - safety_margin
-        self.height = A4[1] - top_margin - bottom_margin - safety_margin
-        
-    def draw(self):
-        """Draw the cover page - note: reportlab uses bottom-left as origin"""
-        canvas = self.canv
-        # Use the declared width/height for content
-        width = self.width
-        height = self.height
-        
-        # Logo and tagline are drawn in _draw_cover_header callback
-        # Calculate exact tagline bottom position to align address immediately after it
-        # The flowable starts at topMargin from page top, which equals the header height
-        # So content should start at the very top of the flowable (y = height)
-        page_height = A4[1]  # A4 page height in points
-        HEADER_TOP_OFFSET = 0.45 * inch  # Match PDFBuilderApp.HEADER_TOP_OFFSET
-        TAGLINE_SPACING = 12  # Points between logo bottom and tagline baseline
-        TAGLINE_FONT_SIZE = 9  # Tagline font size in points
-        TAGLINE_TEXT_MARGIN = 2  # Additional points for text height below baseline
-        
-        # Property Address (large, bold) - handle text wrapping
-        # Position address at top of flowable - no spacing after tagline
-        address = f"{self.data.get('address', '')}, {self.data.get('postal_code', '')}"
-        canvas.setFont("Helvetica-Bold", 24)
-        canvas.setFillColor(colors.black)
-        # Split address if too long (simple approach)
-        address_lines = []
-        words = address.split()
-        current_line = ""
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if canvas.stringWidth(test_line, "Helvetica-Bold", 24) <= width:
-                current_line = test_line
-            else:
-                if current_line:
-                    address_lines.append(current_line)
-                current_line = word
-        if current_line:
-            address_lines.append(current_line)
-        
-        # Position address to match "Investment Opportunity" positioning
-        # Paragraph elements position the first line's baseline accounting for font metrics.
-        # For 24pt Helvetica-Bold, reportlab typically positions baseline ~12-14 points below top.
-        # This accounts for the font's natural positioning in a text flow.
-        font_size = 24  # Match section_title_style fontSize
-        paragraph_baseline_offset = 14 / 72.0 * inch  # ~14 points offset to match Paragraph positioning
-        address_y = height - paragraph_baseline_offset  # Position to match Paragraph baseline
-        for i, line in enumerate(address_lines):
-            canvas.drawString(0, address_y - (i * 0.35*inch), line)
-        
-        # Calculate where the address text area ends
-        # Last line baseline - font height (24pt = ~0.33 inch)
-        last_line_baseline = address_y - (len(address_lines) - 1) * 0.35*inch
-        font_height = 24 / 72.0 * inch  # Convert 24pt to inches
-        address_bottom = last_line_baseline - font_height
-        
-        # Add spacing between address and main image - reduced to push images up
-        spacing_between_text_and_images = 0.1*inch  # Reduced spacing between address and main image
-        
-        # Main image - select from configured sections
-        # Position main image below the address with spacing
-        main_image_height = 4.5*inch
-        main_image_bottom = address_bottom - spacing_between_text_and_images - main_image_height
-        main_image_width = width
-        
-        cover_images = self.images_by_section.get('cover', [])
-        gallery_images = self.images_by_section.get('property', [])
-        fallback_sections = ['floor_plans', 'directions', 'city']
-        
-        main_img_path = None
-        candidate_groups = [cover_images, gallery_images] + [
-            self.images_by_section.get(section_key, []) for section_key in fallback_sections
-        ]
-        for group in candidate_groups:
-            if group:
-                main_img_path = group[0]
-                break
-        
-        # Always draw main image (use placeholder if no image available)
-        try:
-            if main_img_path and os.path.exists(main_img_path):
-                main_img = Image.open(main_img_path)
-                # Calculate dimensions to fit while maintaining aspect ratio
-                img_ratio = main_img.width / main_img.height
-                target_ratio = main_image_width / main_image_height
-                
-                if img_ratio > target_ratio:
-                    # Image is wider, fit to width
-                    draw_width = main_image_width
-                    draw_height = main_image_width / img_ratio
-                else:
-                    # Image is taller, fit to height
-                    draw_height = main_image_height
-                    draw_width = main_image_height * img_ratio
-                
-                # Center the image
-                x_offset = (main_image_width - draw_width) / 2
-                canvas.drawImage(main_img_path, x_offset, main_image_bottom, 
-                               width=draw_width, height=draw_height, preserveAspectRatio=True)
-            else:
-                # Draw gray placeholder rectangle
-                canvas.setFillColor(HexColor('#CCCCCC'))
-                canvas.rect(0, main_image_bottom, main_image_width, main_image_height, fill=1, stroke=0)
-        except Exception as e:
-            print(f"Error adding main image: {e}")
-            # Draw gray placeholder rectangle on error
-            canvas.setFillColor(HexColor('#CCCCCC'))
-            canvas.rect(0, main_image_bottom, main_image_width, main_image_height, fill=1, stroke=0)
-        
-        # Three thumbnail images below main image (exclude the main image)
-        thumbnail_bottom = main_image_bottom - 2*inch
-        thumbnail_height = 1.5*inch
-        thumbnail_width = (width - 0.4*inch) / 3  # 3 thumbnails with spacing
-        
-        thumbnail_images = []
-        thumbnail_candidates = []
-        if len(cover_images) > 1:
-            thumbnail_candidates.extend(cover_images[1:])
-        thumbnail_candidates.extend(img for img in gallery_images if img != main_img_path)
-        
-        for img_path in thumbnail_candidates:
-            if len(thumbnail_images) >= 3:
-                break
-            thumbnail_images.append(img_path)
-        
-        # Track the lowest point of thumbnails to add padding above footer
-        lowest_thumbnail_bottom = thumbnail_bottom
-        
-        # Always show 3 thumbnails (use placeholders if not enough images)
-        for i in range(3):
-            thumb_x = i * (thumbnail_width + 0.2*inch)
-            thumb_y_position = thumbnail_bottom
-            
-            if i < len(thumbnail_images):
-                # Use actual image
-                try:
-                    thumb_img_path = thumbnail_images[i]
-                    if os.path.exists(thumb_img_path):
-                        canvas.drawImage(thumb_img_path, thumb_x, thumb_y_position,
-                                       width=thumbnail_width, height=thumbnail_height, preserveAspectRatio=False)
-                    else:
-                        # Draw gray placeholder
-                        canvas.setFillColor(HexColor('#CCCCCC'))
-                        canvas.rect(thumb_x, thumb_y_position, thumbnail_width, thumbnail_height, fill=1, stroke=0)
-                except Exception as e:
-                    print(f"Error adding thumbnail {i+1}: {e}")
-                    # Draw gray placeholder on error
-                    canvas.setFillColor(HexColor('#CCCCCC'))
-                    canvas.rect(thumb_x, thumb_y_position, thumbnail_width, thumbnail_height, fill=1, stroke=0)
-            else:
-                # Draw gray placeholder for missing thumbnails
-                canvas.setFillColor(HexColor('#CCCCCC'))
-                canvas.rect(thumb_x, thumb_y_position, thumbnail_width, thumbnail_height, fill=1, stroke=0)
-            
-            # All thumbnails have the same bottom position
-            lowest_thumbnail_bottom = thumbnail_bottom
-        
-        # Footer bar with gold background - fixed at the bottom of the page
-        footer_height = 0.4*inch
-        # Always position footer at the bottom of the page (accounting for margins)
-        footer_y = 0  # Bottom of the available canvas area
-        
-        canvas.setFillColor(self.accent_gold)
-        canvas.rect(0, footer_y, width, footer_height, fill=1, stroke=0)
-        
-        # Footer text (centered, white)
-        report_date = format_date_with_ordinal(datetime.datetime.now())
-        footer_text = f"Report created on {report_date}"
-        canvas.setFont("Helvetica", 11)
-        canvas.setFillColor(colors.white)
-        text_width = canvas.stringWidth(footer_text, "Helvetica", 11)
-        # Center text vertically in footer
-        text_y = footer_y + (footer_height / 2) - 0.1*inch  # Adjust for font baseline
-        canvas.drawString((width - text_width) / 2, text_y, footer_text)
+def file_content_hash(path):
+    """Content hash of an image file, cached until the file changes on disk"""
+    stat = os.stat(path)
+    return _hash_file_contents(path, stat.st_mtime, stat.st_size)
+
+# File extensions accepted as property images, matched against the lowercased suffix
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'})
+IMAGE_FILE_PATTERN = " ".join(f"*{ext}" for ext in sorted(IMAGE_EXTENSIONS))
+
+# Filename keywords that place an image in a section, checked in order. A rule matches
+# when every group has at least one keyword in the lowercased filename; plain substrings
+# so names like "floorplan.png" and "directions.png" still match.
+IMAGE_SECTION_RULES = (
+    ('cover', (('exterior',), ('front',))),
+    ('floor_plans', (('floor', 'plan'),)),
+    ('directions', (('direction', 'map', 'city_centre'),)),
+    ('city', (('city', 'liverpool', 'urban'),)),
+)
+
+# Longest edge, in pixels, of photos embedded in the PDF (~230 dpi at full page width)
+MAX_EMBED_IMAGE_PX = 1600
+
+# Most photos downscaled at the same time while preparing a report
+MAX_IMAGE_PREP_WORKERS = 8
+
+# Once a report's images add up to more than this, every image is re-encoded as JPEG
+# (not just oversized ones) whenever that makes it smaller
+RECOMPRESS_REPORT_BYTES = 40 * 1024 * 1024
+
+def prepare_image_for_pdf(path, max_px=MAX_EMBED_IMAGE_PX, recompress=False):
+    """Downscale an oversized photo and re-encode it as JPEG bytes for embedding.
+    
+    Returns None when the image is already small enough to embed as-is, or when
+    recompress is set and re-encoding would not make the file smaller.
+    """
+    with Image.open(path) as img:
+        if max(img.size) <= max_px and not recompress:
+            return None
+        # reducing_gap makes thumbnail() call draft() first, so libjpeg decodes JPEGs
+        # at 1/2, 1/4 or 1/8 scale while staying at least 2x the target size
+        img.thumbnail((max_px, max_px), Image.LANCZOS, reducing_gap=2.0)
+        if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+            # Flatten transparency onto white, as it would appear on the page
+            img = img.convert('RGBA')
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel('A'))
+            img = background
+        buffer = io.BytesIO()
+        img.convert('RGB').save(buffer, 'JPEG', quality=85, optimize=True, progressive=True)
+    # Already well-compressed sources can come out larger; keep those as they are
+    if buffer.tell() >= os.path.getsize(path):
+        return None
+    return buffer.getvalue()
+
+# Characters stripped from currency/percentage inputs before parsing
+_MONEY_DELETE_TABLE = str.maketrans('', '', '£$€,% ')
+
+# Form fields summed into the purchase cost and annual expense totals
+PURCHASE_COST_FIELDS = ('stamp_duty', 'survey_cost', 'legal_fees', 'loan_setup')
+ANNUAL_EXPENSE_FIELDS = ('council_tax', 'repairs_maintenance', 'utilities', 'water', 'broadband_tv', 'insurance')
+
+# Whole-pound currency formatter, e.g. 290000.0 -> '£290,000'
+format_money = '£{:,.0f}'.format
+
+def parse_money(value, default=0.0):
+    """Parse a form value such as '£290,000' or '5.8%' into a float"""
+    try:
+        return float((value or '').translate(_MONEY_DELETE_TABLE))
+    except ValueError:
+        return default
+
+# Form schemas as (label, field name, kind), where kind is 'entry' or 'text'
+
+# Property Info tab fields
+PROPERTY_FIELDS = (
+    ("Property Address:", "address", 'entry'),
+    ("Postal Code:", "postal_code", 'entry'),
+    ("Property Type:", "property_type", 'entry'),
+    ("Bedrooms:", "bedrooms", 'entry'),
+    ("Bathrooms:", "bathrooms", 'entry'),
+    ("Size (sqm):", "size_sqm", 'entry'),
+    ("Asking Price:", "asking_price", 'entry'),
+    ("On Market For (days):", "days_on_market", 'entry'),
+    ("Key Features:", "key_features", 'text'),
+    ("Description:", "description", 'text'),
+)
+
+# Investment Analysis tab fields
+INVESTMENT_FIELDS = (
+    ("Purchase Price:", "purchase_price", 'entry'),
+    ("Deposit (%):", "deposit_percent", 'entry'),
+    ("Estimated Monthly Rent:", "monthly_rent", 'entry'),
+    ("Mortgage Rate (%):", "mortgage_rate", 'entry'),
+    ("Council Tax (annual):", "council_tax", 'entry'),
+    ("Repairs/Maintenance (annual):", "repairs_maintenance", 'entry'),
+    ("Electric/Gas (annual):", "utilities", 'entry'),
+    ("Water (annual):", "water", 'entry'),
+    ("Broadband/TV (annual):", "broadband_tv", 'entry'),
+    ("Insurance (annual):", "insurance", 'entry'),
+    ("Stamp Duty:", "stamp_duty", 'entry'),
+    ("Survey Cost:", "survey_cost", 'entry'),
+    ("Legal Fees:", "legal_fees", 'entry'),
+    ("Loan Set-up:", "loan_setup", 'entry'),
+)
+
+# EPC & Details tab fields
+EPC_FIELDS = (
+    ("EPC Grade:", "epc_grade", 'entry'),
+    ("Current Rating:", "current_rating", 'entry'),
+    ("Potential Rating:", "potential_rating", 'entry'),
+    ("Latest Inspection Date:", "inspection_date", 'entry'),
+    ("Window Glazing:", "window_glazing", 'entry'),
+    ("Building Construction Age:", "building_age", 'entry'),
+    ("Broadband Available:", "broadband_available", 'entry'),
+    ("Highest Download Speed:", "download_speed", 'entry'),
+    ("Highest Upload Speed:", "upload_speed", 'entry'),
+)
+
+# Location & Transport tab fields
+LOCATION_FIELDS = (
+    ("City:", "city", 'entry'),
+    ("Population:", "population", 'entry'),
+    ("Distance to City Centre (miles):", "distance_city_centre", 'entry'),
+    ("Time to City Centre by Car (minutes):", "time_car", 'entry'),
+    ("Time to City Centre by Public Transport (minutes):", "time_public_transport", 'entry'),
+    ("Walk to Station (minutes):", "walk_to_station", 'entry'),
+    ("Station Distance (miles):", "station_distance", 'entry'),
+    ("Bus Routes:", "bus_routes", 'entry'),
+    ("Bus Frequency:", "bus_frequency", 'entry'),
+    ("About the City:", "about_city", 'text'),
+)
+
+# Every form field name, in tab order
+_FORM_SCHEMA = PROPERTY_FIELDS + INVESTMENT_FIELDS + EPC_FIELDS + LOCATION_FIELDS
+FORM_FIELDS = tuple(name for _, name, _ in _FORM_SCHEMA)
+# Fields backed by a multi-line tk.Text rather than a ttk.Entry
+TEXT_FIELDS = frozenset(name for _, name, kind in _FORM_SCHEMA if kind == 'text')
+
+# Bundled example property used to pre-fill the form
+MOCK_DATA = {
+    'address': '5, Ridley Road',
+    'postal_code': 'L6 6DN',
+    'property_type': 'Semi-Detached House',
+    'bedrooms': '5',
+    'bathrooms': '5',
+    'size_sqm': '116',
+    'asking_price': '£290,000',
+    'days_on_market': '6',
+    'key_features': 'Spacious Three Storey HMO Property\nFive Spacious En-Suite Double Bedrooms\nFantastic Investment Opportunity\nContemporary Fitted Kitchen\nCommunal Lounge\nSunny Rear Courtyard\nYield of 10.31%\nClose To Great Local Amenities, Train Station And Road Links\nClose To City Centre\nEPC GRADE = C',
+    'description': 'Beautiful semi-detached family home in excellent condition. Features include modern kitchen, spacious living areas, and a well-maintained garden. Perfect for families looking for comfort and convenience. Located in a quiet residential area with excellent transport links.',
+    'purchase_price': '£290,000',
+    'deposit_percent': '20',
+    'monthly_rent': '£2,750',
+    'mortgage_rate': '5.8',
+    'council_tax': '£1,670',
+    'repairs_maintenance': '£660',
+    'utilities': '£1,080',
+    'water': '£300',
+    'broadband_tv': '£480',
+    'insurance': '£480',
+    'stamp_duty': '£19,000',
+    'survey_cost': '£800',
+    'legal_fees': '£2,400',
+    'loan_setup': '£4,640',
+    'epc_grade': 'C',
+    'current_rating': '84',
+    'potential_rating': '72',
+    'inspection_date': '30th January 2019',
+    'window_glazing': 'Double glazing installed during or after 2002',
+    'building_age': 'before 1900',
+    'broadband_available': 'Broadband available',
+    'download_speed': '1,800 Mbps',
+    'upload_speed': '220 Mbps',
+    'city': 'Liverpool',
+    'population': '508,986',
+    'distance_city_centre': '1.8',
+    'time_car': '6',
+    'time_public_transport': '18',
+    'walk_to_station': '11',
+    'station_distance': '0.5',
+    'bus_routes': '10A / 9',
+    'bus_frequency': 'Every 8 minutes',
+    'about_city': 'Liverpool is a port city and metropolitan borough in Merseyside, England. It is situated on the eastern side of the Mersey Estuary, near the Irish Sea, 178 miles (286 km) north-west of London. With a population of 496,770, Liverpool is the administrative, cultural and economic centre of the Liverpool City Region, a combined authority area with a population of over 1.5 million.'
+}
+
+# Report text filled from the form with str.format_map; fields not supplied read 'N/A'
+EPC_DETAILS_TEMPLATE = (
+    "<b>Latest available inspection date</b><br/>{inspection_date}<br/><br/>"
+    "<b>Window glazing</b><br/>{window_glazing}<br/><br/>"
+    "<b>Building construction age band</b><br/>{building_age}"
+)
+BROADBAND_ITEM_TEMPLATES = (
+    "Broadband available<br/><b>{broadband_available}</b>",
+    "Highest available download speed<br/><b>{download_speed}</b>",
+    "Highest available upload speed<br/><b>{upload_speed}</b>",
+)
+
+# Cell paddings (top, bottom) shared by the report TableStyles and the fixed row heights
+# derived from them; change them here and both stay in step
+TABLE_CELL_LEADING = 12  # ReportLab's default CellStyle leading, one line of text
+DEFAULT_CELL_PADDING = (3, 3)
+PRICE_LABEL_PADDING = (15, 5)
+PRICE_VALUE_PADDING = (5, 15)
+PROFIT_BOX_PADDING = (16, 16)
+TWO_COLUMN_PADDING = (6, 6)
+KEY_METRIC_LABEL_PADDING = (8, 4)
+KEY_METRIC_VALUE_PADDING = (4, 12)
+CITY_IMAGE_PADDING = (5, 5)
+
+def table_row_height(padding, content_height=TABLE_CELL_LEADING):
+    """Height of a table row holding one text line (or content_height) with the given padding"""
+    top_padding, bottom_padding = padding
+    return content_height + top_padding + bottom_padding
 
 class PDFBuilderApp:
     def __init__(self, root):
@@ -278,6 +265,17 @@ class PDFBuilderApp:
         self.property_data = {}
         self.logo_path = get_resource_path("logo.png")
         self.header_logo_image = None
+        # Content hash -> first path seen with those bytes, reset for every PDF
+        self._image_cache = {}
+        # Canonical image path -> width/height ratio, so each header is read once per PDF
+        self._image_aspects = {}
+        # Content hash -> downscaled JPEG file (None if the original is small enough)
+        self._prepared_images = {}
+        # Same, for reports large enough that every image is re-encoded
+        self._recompressed_images = {}
+        self._recompress_images = False
+        # Temporary folder holding the downscaled JPEGs, created on first use
+        self._prepared_dir = None
         
         # Header positioning constant - consistent across all pages
         self.HEADER_TOP_OFFSET = 0.45 * inch  # Distance from top of page to top of logo
@@ -376,11 +374,11 @@ class PDFBuilderApp:
         header_frame.grid(row=0, column=0, sticky=tk.W, pady=(0, 12))
         if os.path.exists(self.logo_path):
             try:
-                logo_image = Image.open(self.logo_path)
-                max_width = 220
-                aspect_ratio = logo_image.height / logo_image.width if logo_image.width else 1
-                resized_height = int(max_width * aspect_ratio)
-                resized_logo = logo_image.resize((max_width, resized_height), Image.LANCZOS)
+                with Image.open(self.logo_path) as logo_image:
+                    max_width = 220
+                    aspect_ratio = logo_image.height / logo_image.width if logo_image.width else 1
+                    resized_height = int(max_width * aspect_ratio)
+                    resized_logo = logo_image.resize((max_width, resized_height), Image.LANCZOS)
                 self.header_logo_image = ImageTk.PhotoImage(resized_logo)
                 ttk.Label(header_frame, image=self.header_logo_image, style="Content.TFrame").pack(side=tk.LEFT)
             except Exception as exc:
@@ -397,6 +395,13 @@ class PDFBuilderApp:
         self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 16))
         self.main_frame.rowconfigure(1, weight=1)
         
+        # Fields on tabs that have not been opened yet are built on first visit;
+        # until then their values are held in _pending_values
+        self.entry_widgets = {}
+        self._pending_tabs = {}
+        self._pending_values = {}
+        self.notebook.bind('<<NotebookTabChanged>>', self._materialize_tab)
+        
         # Create tabs
         self.create_property_tab()
         self.create_investment_tab()
@@ -408,10 +413,14 @@ class PDFBuilderApp:
         button_frame = ttk.Frame(self.main_frame, style="Content.TFrame")
         button_frame.grid(row=2, column=0, pady=(8, 0))
         
-        ttk.Button(button_frame, text="Generate Investment Report PDF",
-                   command=self.generate_pdf).pack(side=tk.LEFT, padx=(0, 12))
+        self.generate_button = ttk.Button(button_frame, text="Generate Investment Report PDF",
+                                          command=self.generate_pdf)
+        self.generate_button.pack(side=tk.LEFT, padx=(0, 12))
         ttk.Button(button_frame, text="Clear All", command=self.clear_all).pack(side=tk.LEFT, padx=(0, 12))
         
+        # Shown only while a PDF is being built in the background
+        self.progress_bar = ttk.Progressbar(button_frame, mode='determinate', length=200)
+        
     def create_property_tab(self):
         """Create Property Information tab"""
         self.property_frame = ttk.Frame(self.notebook)
@@ -422,166 +431,96 @@ class PDFBuilderApp:
         info_frame = ttk.LabelFrame(self.property_frame, text="Property Information", style="Section.TLabelframe")
         info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Property fields
-        fields = [
-            ("Property Address:", "address"),
-            ("Postal Code:", "postal_code"),
-            ("Property Type:", "property_type"),
-            ("Bedrooms:", "bedrooms"),
-            ("Bathrooms:", "bathrooms"),
-            ("Size (sqm):", "size_sqm"),
-            ("Asking Price:", "asking_price"),
-            ("On Market For (days):", "days_on_market"),
-            ("Key Features:", "key_features"),
-            ("Description:", "description")
-        ]
-        
-        self.entry_widgets = {}
-        
-        for i, (label_text, field_name) in enumerate(fields):
-            row_frame = ttk.Frame(info_frame, style="Section.TFrame")
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            ttk.Label(row_frame, text=label_text, width=22, style="Section.TLabel").pack(side=tk.LEFT, padx=(0, 12))
-            
-            if field_name in ["key_features", "description"]:
-                widget = tk.Text(row_frame, height=3, width=60, bg="#ffffff", fg="#111827", wrap="word", insertbackground="#1e3a8a")
-                widget.configure(font=("Segoe UI", 10))
-                widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            else:
-                widget = ttk.Entry(row_frame, width=60)
-                widget.configure(font=("Segoe UI", 10))
-                widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            self.entry_widgets[field_name] = widget
+        self._build_field_rows(info_frame, PROPERTY_FIELDS, label_width=22, entry_width=60)
             
     def create_investment_tab(self):
         """Create Investment Analysis tab"""
         self.investment_frame = ttk.Frame(self.notebook)
         self.investment_frame.pack_propagate(False)
         self.notebook.add(self.investment_frame, text="Investment Analysis")
-        
+        self._pending_tabs[str(self.investment_frame)] = self._build_investment_fields
+    
+    def _build_investment_fields(self):
+        """Build the Investment Analysis fields the first time the tab is shown"""
         # Investment Analysis Section
         investment_frame = ttk.LabelFrame(self.investment_frame, text="Investment Analysis", style="Section.TLabelframe")
         investment_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Investment fields
-        investment_fields = [
-            ("Purchase Price:", "purchase_price"),
-            ("Deposit (%):", "deposit_percent"),
-            ("Estimated Monthly Rent:", "monthly_rent"),
-            ("Mortgage Rate (%):", "mortgage_rate"),
-            ("Council Tax (annual):", "council_tax"),
-            ("Repairs/Maintenance (annual):", "repairs_maintenance"),
-            ("Electric/Gas (annual):", "utilities"),
-            ("Water (annual):", "water"),
-            ("Broadband/TV (annual):", "broadband_tv"),
-            ("Insurance (annual):", "insurance"),
-            ("Stamp Duty:", "stamp_duty"),
-            ("Survey Cost:", "survey_cost"),
-            ("Legal Fees:", "legal_fees"),
-            ("Loan Set-up:", "loan_setup")
-        ]
-        
-        for i, (label_text, field_name) in enumerate(investment_fields):
-            row_frame = ttk.Frame(investment_frame, style="Section.TFrame")
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            ttk.Label(row_frame, text=label_text, width=26, style="Section.TLabel").pack(side=tk.LEFT, padx=(0, 12))
-            
-            widget = ttk.Entry(row_frame, width=30)
-            widget.configure(font=("Segoe UI", 10))
-            widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            self.entry_widgets[field_name] = widget
+        self._build_field_rows(investment_frame, INVESTMENT_FIELDS, label_width=26, entry_width=30)
             
     def create_epc_tab(self):
         """Create EPC & Details tab"""
         self.epc_frame = ttk.Frame(self.notebook)
         self.epc_frame.pack_propagate(False)
         self.notebook.add(self.epc_frame, text="EPC & Details")
-        
+        self._pending_tabs[str(self.epc_frame)] = self._build_epc_fields
+    
+    def _build_epc_fields(self):
+        """Build the EPC & Details fields the first time the tab is shown"""
         # EPC Section
         epc_frame = ttk.LabelFrame(self.epc_frame, text="Energy Performance Certificate", style="Section.TLabelframe")
         epc_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # EPC fields
-        epc_fields = [
-            ("EPC Grade:", "epc_grade"),
-            ("Current Rating:", "current_rating"),
-            ("Potential Rating:", "potential_rating"),
-            ("Latest Inspection Date:", "inspection_date"),
-            ("Window Glazing:", "window_glazing"),
-            ("Building Construction Age:", "building_age"),
-            ("Broadband Available:", "broadband_available"),
-            ("Highest Download Speed:", "download_speed"),
-            ("Highest Upload Speed:", "upload_speed")
-        ]
-        
-        for i, (label_text, field_name) in enumerate(epc_fields):
-            row_frame = ttk.Frame(epc_frame, style="Section.TFrame")
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            ttk.Label(row_frame, text=label_text, width=26, style="Section.TLabel").pack(side=tk.LEFT, padx=(0, 12))
-            
-            widget = ttk.Entry(row_frame, width=30)
-            widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            
-            self.entry_widgets[field_name] = widget
+        self._build_field_rows(epc_frame, EPC_FIELDS, label_width=26, entry_width=30)
             
     def create_location_tab(self):
         """Create Location & Transport tab"""
         self.location_frame = ttk.Frame(self.notebook)
         self.location_frame.pack_propagate(False)
         self.notebook.add(self.location_frame, text="Location & Transport")
-        
+        self._pending_tabs[str(self.location_frame)] = self._build_location_fields
+    
+    def _build_location_fields(self):
+        """Build the Location & Transport fields the first time the tab is shown"""
         # Location Section
         location_frame = ttk.LabelFrame(self.location_frame, text="Location Information", style="Section.TLabelframe")
         location_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Location fields
-        location_fields = [
-            ("City:", "city"),
-            ("Population:", "population"),
-            ("Distance to City Centre (miles):", "distance_city_centre"),
-            ("Time to City Centre by Car (minutes):", "time_car"),
-            ("Time to City Centre by Public Transport (minutes):", "time_public_transport"),
-            ("Walk to Station (minutes):", "walk_to_station"),
-            ("Station Distance (miles):", "station_distance"),
-            ("Bus Routes:", "bus_routes"),
-            ("Bus Frequency:", "bus_frequency"),
-            ("About the City:", "about_city")
-        ]
+        self._build_field_rows(
+            location_frame,
+            LOCATION_FIELDS,
+            label_width=34,
+            entry_width=30,
+            text_width=50,
+            text_height=4,
+            anchor=tk.W,
+            wraplength=260
+        )
         
-        for i, (label_text, field_name) in enumerate(location_fields):
-            row_frame = ttk.Frame(location_frame, style="Section.TFrame")
+        ttk.Button(
+            location_frame,
+            text="Auto-Fill Location From Web",
+            command=self.auto_fill_location_from_web
+        ).pack(anchor=tk.W, pady=(12, 0))
+    
+    def _build_field_rows(self, parent, schema, label_width, entry_width, text_width=None,
+                          text_height=3, **label_options):
+        """Create a label and input row for each (label, field name, kind) in schema"""
+        for label_text, field_name, kind in schema:
+            row_frame = ttk.Frame(parent, style="Section.TFrame")
             row_frame.pack(fill=tk.X, pady=2)
             
-            ttk.Label(
-                row_frame,
-                text=label_text,
-                width=34,
-                anchor=tk.W,
-                wraplength=260,
-                style="Section.TLabel"
-            ).pack(side=tk.LEFT, padx=(0, 12))
+            ttk.Label(row_frame, text=label_text, width=label_width, style="Section.TLabel",
+                      **label_options).pack(side=tk.LEFT, padx=(0, 12))
             
-            if field_name == "about_city":
-                widget = tk.Text(row_frame, height=4, width=50, bg="#ffffff", fg="#111827", wrap="word", insertbackground="#1e3a8a")
-                widget.configure(font=("Segoe UI", 10))
-                widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            if kind == 'text':
+                widget = tk.Text(row_frame, height=text_height, width=text_width or entry_width, bg="#ffffff",
+                                 fg="#111827", wrap="word", insertbackground="#1e3a8a")
             else:
-                widget = ttk.Entry(row_frame, width=30)
-                widget.configure(font=("Segoe UI", 10))
-                widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
+                widget = ttk.Entry(row_frame, width=entry_width)
+            widget.configure(font=("Segoe UI", 10))
+            widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
             
             self.entry_widgets[field_name] = widget
-        
-        ttk.Button(
-            location_frame,
-            text="Auto-Fill Location From Web",
-            command=self.auto_fill_location_from_web
-        ).pack(anchor=tk.W, pady=(12, 0))
+    
+    def _materialize_tab(self, event=None):
+        """Build a deferred tab's fields on first visit and fill them with any pending values"""
+        builder = self._pending_tabs.pop(self.notebook.select(), None)
+        if builder is None:
+            return
+        builder()
+        for field_name in [name for name in self._pending_values if name in self.entry_widgets]:
+            self._set_widget_value(field_name, self._pending_values.pop(field_name))
             
     def create_images_tab(self):
         """Create Images tab"""
@@ -698,21 +637,12 @@ class PDFBuilderApp:
         """Prompt user to add images to a specific section"""
         file_paths = filedialog.askopenfilenames(
             title="Select Images",
-            filetypes=[("Image files", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff *.webp")]
+            filetypes=[("Image files", IMAGE_FILE_PATTERN)]
         )
         if not file_paths:
             return
         
-        config = self.image_sections_config.get(section_key, {})
-        for file_path in file_paths:
-            max_items = config.get('max_items')
-            if max_items and len(self.image_sections[section_key]) >= max_items:
-                messagebox.showwarning(
-                    "Image limit reached",
-                    f"{config['title']} allows up to {max_items} image(s). Remove an image before adding a new one."
-                )
-                break
-            self._add_image_path(section_key, file_path, skip_duplicates=True)
+        self._add_image_paths(section_key, file_paths, skip_duplicates=True)
     
     def remove_selected_image(self, section_key):
         """Remove the selected image from a section"""
@@ -736,12 +666,12 @@ class PDFBuilderApp:
             images = self.image_sections[section_key]
             images[index], images[index - 1] = images[index - 1], images[index]
             
-            current_text = listbox.get(index)
-            above_text = listbox.get(index - 1)
-            listbox.delete(index - 1, index)
-            listbox.insert(index - 1, current_text)
-            listbox.insert(index, above_text)
+            # Only the moved row is touched; the neighbour shifts into its place.
+            # Rows show the file name, so the text comes from the list rather than Tk
+            listbox.delete(index)
+            listbox.insert(index - 1, os.path.basename(images[index - 1]))
             listbox.selection_set(index - 1)
+            listbox.see(index - 1)
     
     def move_image_down_in_section(self, section_key):
         """Move the selected image down within a section"""
@@ -754,12 +684,12 @@ class PDFBuilderApp:
             index = selection[0]
             images[index], images[index + 1] = images[index + 1], images[index]
             
-            current_text = listbox.get(index)
-            below_text = listbox.get(index + 1)
-            listbox.delete(index, index + 1)
-            listbox.insert(index, below_text)
-            listbox.insert(index + 1, current_text)
+            # Only the moved row is touched; the neighbour shifts into its place.
+            # Rows show the file name, so the text comes from the list rather than Tk
+            listbox.delete(index)
+            listbox.insert(index + 1, os.path.basename(images[index + 1]))
             listbox.selection_set(index + 1)
+            listbox.see(index + 1)
     
     def auto_fill_location_from_web(self):
         """Attempt to populate the Location & Transport fields using online open-data sources."""
@@ -867,23 +797,25 @@ class PDFBuilderApp:
     
     def _apply_location_data(self, data):
         for field, value in data.items():
-            if field not in self.entry_widgets or value is None:
+            if field not in FORM_FIELDS or value is None:
                 continue
             self._set_widget_value(field, value)
     
     def _get_widget_value(self, field_name):
         widget = self.entry_widgets.get(field_name)
         if not widget:
-            return ""
-        if isinstance(widget, tk.Text):
+            return self._pending_values.get(field_name, "")
+        if field_name in TEXT_FIELDS:
             return widget.get("1.0", tk.END).strip()
         return widget.get().strip()
     
     def _set_widget_value(self, field_name, value):
         widget = self.entry_widgets.get(field_name)
         if not widget:
+            if field_name in FORM_FIELDS:
+                self._pending_values[field_name] = value
             return
-        if isinstance(widget, tk.Text):
+        if field_name in TEXT_FIELDS:
             widget.delete("1.0", tk.END)
             widget.insert("1.0", value)
         else:
@@ -1099,86 +1031,38 @@ class PDFBuilderApp:
             if listbox:
                 listbox.delete(0, tk.END)
     
-    def _add_image_path(self, section_key, file_path, skip_duplicates=False, skip_if_full=False):
-        """Internal helper to add an image path to a section and update UI"""
+    def _add_image_paths(self, section_key, file_paths, skip_duplicates=False, skip_if_full=False):
+        """Internal helper to add image paths to a section and update the UI in one batch"""
         images = self.image_sections.setdefault(section_key, [])
         config = self.image_sections_config.get(section_key, {})
         max_items = config.get('max_items')
         
-        if skip_duplicates and file_path in images:
-            return
-        
-        if max_items and len(images) >= max_items:
-            if skip_if_full:
-                return
-            messagebox.showwarning(
-                "Image limit reached",
-                f"{config.get('title', 'This section')} allows up to {max_items} image(s)."
-            )
-            return
+        added = []
+        for file_path in file_paths:
+            if skip_duplicates and file_path in images:
+                continue
+            
+            if max_items and len(images) >= max_items:
+                if not skip_if_full:
+                    messagebox.showwarning(
+                        "Image limit reached",
+                        f"{config.get('title', 'This section')} allows up to {max_items} image(s). "
+                        "Remove an image before adding a new one."
+                    )
+                break
+            
+            images.append(file_path)
+            added.append(os.path.basename(file_path))
         
-        images.append(file_path)
+        # A single insert call avoids one Tk round trip per file
         listbox = self.image_listboxes.get(section_key)
-        if listbox:
-            listbox.insert(tk.END, os.path.basename(file_path))
+        if listbox and added:
+            listbox.insert(tk.END, *added)
     
     def load_mock_data_defaults(self):
         """Populate the form with bundled mock data for quicker previews."""
-        mock_data = {
-            'address': '5, Ridley Road',
-            'postal_code': 'L6 6DN',
-            'property_type': 'Semi-Detached House',
-            'bedrooms': '5',
-            'bathrooms': '5',
-            'size_sqm': '116',
-            'asking_price': '£290,000',
-            'days_on_market': '6',
-            'key_features': 'Spacious Three Storey HMO Property\nFive Spacious En-Suite Double Bedrooms\nFantastic Investment Opportunity\nContemporary Fitted Kitchen\nCommunal Lounge\nSunny Rear Courtyard\nYield of 10.31%\nClose To Great Local Amenities, Train Station And Road Links\nClose To City Centre\nEPC GRADE = C',
-            'description': 'Beautiful semi-detached family home in excellent condition. Features include modern kitchen, spacious living areas, and a well-maintained garden. Perfect for families looking for comfort and convenience. Located in a quiet residential area with excellent transport links.',
-            'purchase_price': '£290,000',
-            'deposit_percent': '20',
-            'monthly_rent': '£2,750',
-            'mortgage_rate': '5.8',
-            'council_tax': '£1,670',
-            'repairs_maintenance': '£660',
-            'utilities': '£1,080',
-            'water': '£300',
-            'broadband_tv': '£480',
-            'insurance': '£480',
-            'stamp_duty': '£19,000',
-            'survey_cost': '£800',
-            'legal_fees': '£2,400',
-            'loan_setup': '£4,640',
-            'epc_grade': 'C',
-            'current_rating': '84',
-            'potential_rating': '72',
-            'inspection_date': '30th January 2019',
-            'window_glazing': 'Double glazing installed during or after 2002',
-            'building_age': 'before 1900',
-            'broadband_available': 'Broadband available',
-            'download_speed': '1,800 Mbps',
-            'upload_speed': '220 Mbps',
-            'city': 'Liverpool',
-            'population': '508,986',
-            'distance_city_centre': '1.8',
-            'time_car': '6',
-            'time_public_transport': '18',
-            'walk_to_station': '11',
-            'station_distance': '0.5',
-            'bus_routes': '10A / 9',
-            'bus_frequency': 'Every 8 minutes',
-            'about_city': 'Liverpool is a port city and metropolitan borough in Merseyside, England. It is situated on the eastern side of the Mersey Estuary, near the Irish Sea, 178 miles (286 km) north-west of London. With a population of 496,770, Liverpool is the administrative, cultural and economic centre of the Liverpool City Region, a combined authority area with a population of over 1.5 million.'
-        }
-        for field_name, value in mock_data.items():
-            widget = self.entry_widgets.get(field_name)
-            if not widget:
-                continue
-            if isinstance(widget, tk.Text):
-                widget.delete("1.0", tk.END)
-                widget.insert("1.0", value)
-            else:
-                widget.delete(0, tk.END)
-                widget.insert(0, value)
+        for field_name, value in MOCK_DATA.items():
+            self._set_widget_value(field_name, value)
     
     def load_default_images(self):
         """Load bundled sample images into their sections as placeholders."""
@@ -1186,20 +1070,26 @@ class PDFBuilderApp:
         if not os.path.exists(sample_folder):
             return
         self.clear_image_sections()
-        image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
-        for filename in sorted(os.listdir(sample_folder)):
-            if not filename.lower().endswith(image_extensions):
-                continue
-            image_path = os.path.join(sample_folder, filename)
-            section_key = self.get_image_section(filename)
-            self._add_image_path(section_key, image_path, skip_duplicates=True, skip_if_full=True)
+        with os.scandir(sample_folder) as entries:
+            image_entries = [
+                entry for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                and entry.is_file()
+            ]
+        paths_by_section = {}
+        for entry in sorted(image_entries, key=lambda entry: entry.name):
+            section_key = self.get_image_section(entry.name)
+            paths_by_section.setdefault(section_key, []).append(entry.path)
+        for section_key, image_paths in paths_by_section.items():
+            self._add_image_paths(section_key, image_paths, skip_duplicates=True, skip_if_full=True)
     
     def _draw_cover_header(self, canvas, doc):
         """Cover page - draw logo and tagline consistent with standard header."""
-        if not os.path.exists(self.logo_path):
+        from report_flowables import TAGLINE_GREY
+        if not self._logo_exists:
             return
         try:
-            logo_reader = ImageReader(self.logo_path)
+            logo_reader = self._logo_reader
             canvas.saveState()
             img_width, img_height = logo_reader.getSize()
             if not img_width or not img_height:
@@ -1226,7 +1116,7 @@ class PDFBuilderApp:
             TAGLINE_FONT_SIZE = 9
             TAGLINE_SPACING = 12  # Points between logo bottom and tagline baseline
             canvas.setFont("Helvetica", TAGLINE_FONT_SIZE)  # Match standard header
-            canvas.setFillColor(HexColor('#334155'))  # Match standard header
+            canvas.setFillColor(TAGLINE_GREY)  # Match standard header
             tagline_y = logo_y - TAGLINE_SPACING
             canvas.drawString(
                 logo_x,
@@ -1239,10 +1129,11 @@ class PDFBuilderApp:
     
     def _draw_standard_header(self, canvas, doc):
         """Draw consistent logo and tagline at the top of every PDF page."""
-        if not os.path.exists(self.logo_path):
+        from report_flowables import TAGLINE_GREY
+        if not self._logo_exists:
             return
         try:
-            logo_reader = ImageReader(self.logo_path)
+            logo_reader = self._logo_reader
             canvas.saveState()
             img_width, img_height = logo_reader.getSize()
             if not img_width or not img_height:
@@ -1269,7 +1160,7 @@ class PDFBuilderApp:
             TAGLINE_FONT_SIZE = 9
             TAGLINE_SPACING = 12  # Points between logo bottom and tagline baseline
             canvas.setFont("Helvetica", TAGLINE_FONT_SIZE)
-            canvas.setFillColor(HexColor('#334155'))
+            canvas.setFillColor(TAGLINE_GREY)
             tagline_y = logo_y - TAGLINE_SPACING
             canvas.drawString(
                 logo_x,
@@ -1283,263 +1174,141 @@ class PDFBuilderApp:
     def get_image_section(self, filename):
         """Infer the most suitable section for an image based on its filename"""
         filename_lower = filename.lower()
-        if 'exterior' in filename_lower and 'front' in filename_lower:
-            return 'cover'
-        if 'floor' in filename_lower or 'plan' in filename_lower:
-            return 'floor_plans'
-        if 'direction' in filename_lower or 'map' in filename_lower or 'city_centre' in filename_lower:
-            return 'directions'
-        if 'city' in filename_lower or 'liverpool' in filename_lower or 'urban' in filename_lower:
-            return 'city'
+        for section_key, keyword_groups in IMAGE_SECTION_RULES:
+            if all(any(keyword in filename_lower for keyword in group) for group in keyword_groups):
+                return section_key
         return 'property'
             
     def clear_all(self):
         """Clear all form data"""
-        for widget in self.entry_widgets.values():
-            if isinstance(widget, tk.Text):
+        for field_name, widget in self.entry_widgets.items():
+            if field_name in TEXT_FIELDS:
                 widget.delete("1.0", tk.END)
             else:
                 widget.delete(0, tk.END)
+        self._pending_values.clear()
         
         self.clear_image_sections()
         
         
-    def generate_pdf(self):
-        """Generate the comprehensive investment report PDF with professional styling"""
-        try:
-            # Get all form data
-            data = {}
-            for field_name, widget in self.entry_widgets.items():
-                if isinstance(widget, tk.Text):
-                    data[field_name] = widget.get("1.0", tk.END).strip()
-                else:
-                    data[field_name] = widget.get().strip()
-            
-            # Check if we have at least an address
-            if not data.get('address'):
-                messagebox.showerror("Error", "Please enter at least the property address.")
-                return
-            
-            # Ask for output file location
-            default_filename = f"{data.get('address', 'Property')} - Investment Report.pdf"
-            file_path = filedialog.asksaveasfilename(
-                title="Save Investment Report As",
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf")],
-                initialfile=default_filename
-            )
-            
-            if not file_path:
-                return
-            
-            print(f"Generating PDF: {file_path}")
-            
-            # Calculate exact header height for consistent spacing (before creating doc)
-            # Use the same HEADER_TOP_OFFSET constant for consistency
-            # Header positioning:
-            #   - Logo top: HEADER_TOP_OFFSET from page top (0.45")
-            #   - Logo height: get actual height from logo image for accuracy
-            #   - Tagline spacing: 12 points below logo bottom
-            #   - Tagline font: 9pt, with ~2pt margin for text height
-            #   - Content spacing: 0 below tagline bottom (content starts immediately)
-            TAGLINE_SPACING_POINTS = 12  # Points between logo bottom and tagline baseline
-            TAGLINE_FONT_SIZE = 9  # Tagline font size in points
-            TAGLINE_TEXT_MARGIN = 2  # Additional points for text height below baseline
-            TAGLINE_TOTAL_HEIGHT = (TAGLINE_SPACING_POINTS + TAGLINE_FONT_SIZE + TAGLINE_TEXT_MARGIN) / 72.0 * inch  # Convert to inches
-            HEADER_TO_CONTENT_SPACING = 0  # No space from tagline bottom to first content - content starts immediately
-            
-            # Get actual logo height for accurate top margin calculation
-            logo_width = 1.4 * inch  # Standard logo width
-            LOGO_ACTUAL_HEIGHT = 0.6*inch  # Default fallback
-            if os.path.exists(self.logo_path):
-                try:
-                    from reportlab.lib.utils import ImageReader
-                    logo_reader = ImageReader(self.logo_path)
-                    img_width, img_height = logo_reader.getSize()
-                    if img_width and img_height:
-                        LOGO_ACTUAL_HEIGHT = logo_width * (img_height / img_width)
-                except Exception:
-                    pass  # Use default if can't read logo
-            
-            # Total: top offset + actual logo height + tagline (no content spacing)
-            REQUIRED_TOP_MARGIN = self.HEADER_TOP_OFFSET + LOGO_ACTUAL_HEIGHT + TAGLINE_TOTAL_HEIGHT + HEADER_TO_CONTENT_SPACING
-            
-            # Create PDF document with custom margins
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=A4,
-                leftMargin=0.75*inch,
-                rightMargin=0.75*inch,
-                topMargin=REQUIRED_TOP_MARGIN,
-                bottomMargin=0.75*inch
-            )
-            story = []
-            
-            cover_images = list(self.image_sections.get('cover', []))
-            property_gallery_images = list(self.image_sections.get('property', []))
-            floor_plan_images = list(self.image_sections.get('floor_plans', []))
-            directions_images = list(self.image_sections.get('directions', []))
-            city_images = list(self.image_sections.get('city', []))
-            
-            # Define professional color scheme
-            primary_blue = HexColor('#1e3a8a')  # Dark blue
-            accent_gold = HexColor('#f59e0b')   # Gold
-            light_grey = HexColor('#f8fafc')   # Light grey
-            dark_grey = HexColor('#374151')    # Dark grey
-            success_green = HexColor('#10b981') # Green
-            warning_orange = HexColor('#f59e0b') # Orange
-            
-            # Standard spacing constants for consistency
-            # No spacing needed after page breaks - top margin already accounts for header
-            STANDARD_PAGE_BREAK_SPACING = 0  # No extra space - top margin handles header positioning
-            STANDARD_SECTION_SPACING = 20  # Space after section title (points)
-            STANDARD_IMAGE_SPACING = 20  # Space after images (points)
-            STANDARD_TABLE_SPACING = 20  # Space after tables (points)
-            STANDARD_CONTENT_SPACING = 12  # Space between content elements (points)
-            STANDARD_SUBSECTION_SPACING = 15  # Space after subsection headers (points)
-            
-            # Get styles
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle(
+    @cached_property
+    def _paragraph_styles(self):
+        """Report paragraph styles, built on first use and shared by every PDF"""
+        from reportlab.lib import colors
+        from report_flowables import PRIMARY_BLUE, DARK_GREY, MUTED_GREY
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        primary_blue = PRIMARY_BLUE
+        dark_grey = DARK_GREY
+        base = getSampleStyleSheet()
+        return {
+            'title': ParagraphStyle(
                 'CustomTitle',
-                parent=styles['Heading1'],
+                parent=base['Heading1'],
                 fontSize=28,
                 spaceAfter=20,
                 alignment=TA_CENTER,
                 textColor=primary_blue,
                 fontName='Helvetica-Bold'
-            )
-            
-            header_style = ParagraphStyle(
+            ),
+            'header': ParagraphStyle(
                 'CustomHeader',
-                parent=styles['Heading2'],
+                parent=base['Heading2'],
                 fontSize=18,
-                spaceAfter=STANDARD_SUBSECTION_SPACING,
+                spaceAfter=15,  # Standard subsection spacing
                 spaceBefore=0,
                 textColor=primary_blue,
                 fontName='Helvetica-Bold'
-            )
-            
-            subheader_style = ParagraphStyle(
+            ),
+            'subheader': ParagraphStyle(
                 'CustomSubHeader',
-                parent=styles['Heading3'],
+                parent=base['Heading3'],
                 fontSize=14,
-                spaceAfter=STANDARD_CONTENT_SPACING,
+                spaceAfter=12,  # Standard content spacing
                 spaceBefore=0,
                 textColor=dark_grey,
                 fontName='Helvetica-Bold'
-            )
-            
-            body_style = ParagraphStyle(
+            ),
+            'body': ParagraphStyle(
                 'CustomBody',
-                parent=styles['Normal'],
+                parent=base['Normal'],
                 fontSize=11,
                 spaceAfter=8,
                 textColor=dark_grey,
                 fontName='Helvetica'
-            )
-            
-            highlight_style = ParagraphStyle(
+            ),
+            'highlight': ParagraphStyle(
                 'CustomHighlight',
-                parent=styles['Normal'],
+                parent=base['Normal'],
                 fontSize=12,
                 spaceAfter=8,
                 textColor=primary_blue,
                 fontName='Helvetica-Bold'
-            )
-
-            section_title_style = ParagraphStyle(
+            ),
+            'section_title': ParagraphStyle(
                 'SectionTitle',
-                parent=styles['Heading1'],
+                parent=base['Heading1'],
                 fontSize=24,
                 spaceAfter=0,  # Use explicit Spacer for consistency
                 spaceBefore=0,
                 textColor=colors.black,
                 fontName='Helvetica-Bold',
                 alignment=TA_LEFT
-            )
-            
-            # Create cover page (first page)
-            cover_page = self.create_cover_page(data, accent_gold, primary_blue)
-            if cover_page:
-                story.append(cover_page)
-                story.append(PageBreak())
-                # No spacer needed - top margin already accounts for header
-            
-            # Investment Opportunity Section - Second Page Design
-            story.append(Paragraph("Investment Opportunity", section_title_style))
-            story.append(Spacer(1, STANDARD_SECTION_SPACING))
-            
-            # Calculate investment metrics
-            try:
-                purchase_price = float(data.get('purchase_price', '0').replace('£', '').replace(',', ''))
-                deposit_percent = float(data.get('deposit_percent', '20'))
-                monthly_rent = float(data.get('monthly_rent', '0').replace('£', '').replace(',', ''))
-                mortgage_rate = float(data.get('mortgage_rate', '5.8'))
-                
-                deposit_amount = purchase_price * (deposit_percent / 100)
-                annual_rent = monthly_rent * 12
-                rental_yield = (annual_rent / purchase_price) * 100
-                
-                # Calculate costs
-                stamp_duty = float(data.get('stamp_duty', '0').replace('£', '').replace(',', ''))
-                survey_cost = float(data.get('survey_cost', '0').replace('£', '').replace(',', ''))
-                legal_fees = float(data.get('legal_fees', '0').replace('£', '').replace(',', ''))
-                loan_setup = float(data.get('loan_setup', '0').replace('£', '').replace(',', ''))
-                
-                total_purchase_costs = stamp_duty + survey_cost + legal_fees + loan_setup
-                total_investment = deposit_amount + total_purchase_costs
-                
-                # Calculate expenses
-                mortgage_amount = purchase_price - deposit_amount
-                annual_mortgage_interest = mortgage_amount * (mortgage_rate / 100)
-                
-                council_tax = float(data.get('council_tax', '0').replace('£', '').replace(',', ''))
-                repairs = float(data.get('repairs_maintenance', '0').replace('£', '').replace(',', ''))
-                utilities = float(data.get('utilities', '0').replace('£', '').replace(',', ''))
-                water = float(data.get('water', '0').replace('£', '').replace(',', ''))
-                broadband = float(data.get('broadband_tv', '0').replace('£', '').replace(',', ''))
-                insurance = float(data.get('insurance', '0').replace('£', '').replace(',', ''))
-                
-                total_annual_expenses = annual_mortgage_interest + council_tax + repairs + utilities + water + broadband + insurance
-                annual_profit = annual_rent - total_annual_expenses
-                monthly_profit = annual_profit / 12
-                roi = (annual_profit / total_investment) * 100
-                
-            except (ValueError, ZeroDivisionError):
-                # Default values if calculation fails
-                purchase_price = 0
-                deposit_amount = 0
-                monthly_rent = 0
-                rental_yield = 0
-                total_investment = 0
-                total_annual_expenses = 0
-                annual_profit = 0
-                monthly_profit = 0
-                roi = 0
-            
-            # Three Key Metrics Boxes (horizontal gold boxes) - individual boxes, bigger
-            box_width = 2.4*inch
-            box_spacing = 0.15*inch  # Space between boxes
-            
-            # Create three individual boxes side by side with spacing
-            metrics_table = Table([
-                ['Purchase Price', '', 'Estimated Monthly Rent', '', 'Rental Yield'],
-                [f"£{purchase_price:,.0f}", '', f"£{monthly_rent:,.0f}pcm", '', f"{rental_yield:.1f}%"]
-            ], colWidths=[box_width, box_spacing, box_width, box_spacing, box_width])
-            metrics_table.setStyle(TableStyle([
+            ),
+            'key_feature': ParagraphStyle(
+                'KeyFeature', parent=base['Normal'],
+                fontSize=11, textColor=colors.black,
+                leftIndent=20, spaceAfter=5  # Reduced spacing to fit on page
+            ),
+            'epc_title': ParagraphStyle(
+                'EPCTitle', parent=base['Heading2'], fontSize=14,
+                textColor=colors.black, fontName='Helvetica-Bold'
+            ),
+            'epc_details': ParagraphStyle(
+                'EPCDetails', parent=base['Normal'],
+                fontSize=11, textColor=colors.black,
+                leftIndent=0
+            ),
+            'epc_disclaimer': ParagraphStyle(
+                'EPCDisclaimer', parent=base['Normal'],
+                fontSize=9, textColor=MUTED_GREY
+            ),
+            'broadband_title': ParagraphStyle(
+                'BroadbandTitle', parent=base['Heading2'], fontSize=14,
+                textColor=colors.black, fontName='Helvetica-Bold'
+            ),
+            'broadband_item': ParagraphStyle(
+                'BroadbandItem', parent=base['Normal'],
+                fontSize=11, textColor=colors.black
+            ),
+        }
+    
+    @cached_property
+    def _table_styles(self):
+        """Build the report's fixed TableStyles once per app instance"""
+        from reportlab.lib import colors
+        from reportlab.platypus import TableStyle
+        from report_flowables import ACCENT_GOLD
+        return {
+            # Top-left alignment shared by every single-cell image table
+            'left_aligned': TableStyle([
+                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+                ('VALIGN', (0, 0), (0, 0), 'TOP'),
+                ('TOPPADDING', (0, 0), (0, 0), DEFAULT_CELL_PADDING[0]),
+                ('BOTTOMPADDING', (0, 0), (0, 0), DEFAULT_CELL_PADDING[1]),
+            ]),
+            # Purchase price, rent and yield boxes
+            'price_metrics': TableStyle([
                 # First box (Purchase Price)
-                ('BACKGROUND', (0, 0), (0, 1), accent_gold),
+                ('BACKGROUND', (0, 0), (0, 1), ACCENT_GOLD),
                 ('TEXTCOLOR', (0, 0), (0, 0), colors.black),
                 ('TEXTCOLOR', (0, 1), (0, 1), colors.white),
                 # Second box (Monthly Rent)
-                ('BACKGROUND', (2, 0), (2, 1), accent_gold),
+                ('BACKGROUND', (2, 0), (2, 1), ACCENT_GOLD),
                 ('TEXTCOLOR', (2, 0), (2, 0), colors.black),
                 ('TEXTCOLOR', (2, 1), (2, 1), colors.white),
                 # Third box (Rental Yield)
-                ('BACKGROUND', (4, 0), (4, 1), accent_gold),
+                ('BACKGROUND', (4, 0), (4, 1), ACCENT_GOLD),
                 ('TEXTCOLOR', (4, 0), (4, 0), colors.black),
                 ('TEXTCOLOR', (4, 1), (4, 1), colors.white),
                 # Spacing columns (white background)
@@ -1553,54 +1322,38 @@ class PDFBuilderApp:
                 ('FONTSIZE', (0, 0), (4, 0), 12),
                 ('FONTNAME', (0, 1), (4, 1), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 1), (4, 1), 24),
+                ('LEADING', (0, 0), (4, 1), TABLE_CELL_LEADING),
                 # Padding - bigger boxes
-                ('TOPPADDING', (0, 0), (4, 0), 15),
-                ('BOTTOMPADDING', (0, 0), (4, 0), 5),
-                ('TOPPADDING', (0, 1), (4, 1), 5),
-                ('BOTTOMPADDING', (0, 1), (4, 1), 15),
+                ('TOPPADDING', (0, 0), (4, 0), PRICE_LABEL_PADDING[0]),
+                ('BOTTOMPADDING', (0, 0), (4, 0), PRICE_LABEL_PADDING[1]),
+                ('TOPPADDING', (0, 1), (4, 1), PRICE_VALUE_PADDING[0]),
+                ('BOTTOMPADDING', (0, 1), (4, 1), PRICE_VALUE_PADDING[1]),
                 ('LEFTPADDING', (0, 0), (4, -1), 12),
                 ('RIGHTPADDING', (0, 0), (4, -1), 12),
-            ]))
-            story.append(metrics_table)
-            story.append(Spacer(1, STANDARD_TABLE_SPACING))
-            
-            # Two Column Layout for Costs and Expenses
-            # Left Column: Total Purchase Costs
-            purchase_costs_data = [
-                ['Total Purchase Costs', ''],
-                ['Deposit(20%)', f"£{deposit_amount:,.0f}"],
-                ['Stamp Duty', f"£{stamp_duty:,.0f}"],
-                ['Survey', f"£{survey_cost:,.0f}"],
-                ['Legal Fees', f"£{legal_fees:,.0f}"],
-                ['Loan Set-up', f"£{loan_setup:,.0f}"],
-                ['Total Investment Required', f"£{total_investment:,.0f}"]
-            ]
-            
-            # Right Column: Total Annual Expenses
-            expenses_data = [
-                ['Total Annual Expenses', ''],
-                [f'Mortgage @ {mortgage_rate}% (Interest Only)', f"£{annual_mortgage_interest:,.0f}"],
-                ['Council Tax', f"£{council_tax:,.0f}"],
-                ['Repairs / Maintenance', f"£{repairs:,.0f}"],
-                ['Electric / Gas', f"£{utilities:,.0f}"],
-                ['Water', f"£{water:,.0f}"],
-                ['Broadband / TV', f"£{broadband:,.0f}"],
-                ['Insurance', f"£{insurance:,.0f}"],
-                ['Total', f"£{total_annual_expenses:,.0f}"]
-            ]
-            
-            # Create two-column table
-            two_col_data = []
-            max_rows = max(len(purchase_costs_data), len(expenses_data))
-            for i in range(max_rows):
-                left_col = purchase_costs_data[i] if i < len(purchase_costs_data) else ['', '']
-                right_col = expenses_data[i] if i < len(expenses_data) else ['', '']
-                two_col_data.append([left_col[0], left_col[1], right_col[0], right_col[1]])
-            
-            two_col_table = Table(two_col_data, colWidths=[2.2*inch, 1.3*inch, 2.2*inch, 1.3*inch])
-            
-            # Add horizontal lines between all rows
-            table_style_commands = [
+            ]),
+            # Monthly profit, annual profit and ROI boxes
+            'profit': TableStyle([
+                ('BACKGROUND', (1, 0), (1, -1), ACCENT_GOLD),
+                ('BACKGROUND', (2, 0), (2, -1), ACCENT_GOLD),
+                ('TEXTCOLOR', (1, 0), (1, -1), colors.black),  # Labels in black
+                ('TEXTCOLOR', (2, 0), (2, -1), colors.white),  # Values in white bold
+                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+                ('VALIGN', (1, 0), (2, -1), 'MIDDLE'),
+                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+                ('FONTSIZE', (1, 0), (1, -1), 13),  # Bigger labels
+                ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (2, 0), (2, -1), 24),  # Bigger values
+                ('LEADING', (1, 0), (2, -1), TABLE_CELL_LEADING),
+                ('TOPPADDING', (1, 0), (2, -1), PROFIT_BOX_PADDING[0]),  # Bigger boxes
+                ('BOTTOMPADDING', (1, 0), (2, -1), PROFIT_BOX_PADDING[1]),
+                ('LEFTPADDING', (1, 0), (1, -1), 18),
+                ('RIGHTPADDING', (1, 0), (1, -1), 12),
+                ('LEFTPADDING', (2, 0), (2, -1), 12),
+                ('RIGHTPADDING', (2, 0), (2, -1), 18),
+            ]),
+            # Purchase costs and annual expenses; row rules are added per report
+            'two_column': TableStyle([
                 # Header rows
                 ('BACKGROUND', (0, 0), (1, 0), colors.white),
                 ('BACKGROUND', (2, 0), (3, 0), colors.white),
@@ -1615,226 +1368,32 @@ class PDFBuilderApp:
                 ('FONTSIZE', (0, 1), (-1, -1), 11),
                 # Total row styling (bold)
                 ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('LEADING', (0, 0), (-1, -1), TABLE_CELL_LEADING),
+                ('TOPPADDING', (0, 0), (-1, -1), TWO_COLUMN_PADDING[0]),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), TWO_COLUMN_PADDING[1]),
                 ('LEFTPADDING', (0, 0), (0, -1), 5),
                 ('RIGHTPADDING', (1, 0), (1, -1), 5),
                 ('LEFTPADDING', (2, 0), (2, -1), 15),
                 ('RIGHTPADDING', (3, 0), (3, -1), 5),
-            ]
-            
-            # Add horizontal lines between all rows (light grey lines)
-            for row_idx in range(1, len(two_col_data)):
-                # Left column line - spans full width of left column
-                table_style_commands.append(('LINEBELOW', (0, row_idx), (1, row_idx), 0.5, HexColor('#E0E0E0')))
-                # Right column line - spans full width of right column
-                table_style_commands.append(('LINEBELOW', (2, row_idx), (3, row_idx), 0.5, HexColor('#E0E0E0')))
-            
-            two_col_table.setStyle(TableStyle(table_style_commands))
-            
-            # Three Vertical Boxes for Profit/ROI (positioned at bottom right, bigger)
-            # Create table with left column empty and boxes on the right
-            profit_table = Table([
-                ['', 'Monthly Profit', f"£{monthly_profit:,.0f}"],
-                ['', 'Annual Profit', f"£{annual_profit:,.0f}"],
-                ['', 'ROI', f"{roi:.1f}%"]
-            ], colWidths=[3.5*inch, 2*inch, 2*inch])
-            profit_table.setStyle(TableStyle([
-                ('BACKGROUND', (1, 0), (1, -1), accent_gold),
-                ('BACKGROUND', (2, 0), (2, -1), accent_gold),
-                ('TEXTCOLOR', (1, 0), (1, -1), colors.black),  # Labels in black
-                ('TEXTCOLOR', (2, 0), (2, -1), colors.white),  # Values in white bold
-                ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-                ('VALIGN', (1, 0), (2, -1), 'MIDDLE'),
-                ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                ('FONTSIZE', (1, 0), (1, -1), 13),  # Bigger labels
-                ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (2, 0), (2, -1), 24),  # Bigger values
-                ('TOPPADDING', (1, 0), (2, -1), 16),  # Bigger boxes
-                ('BOTTOMPADDING', (1, 0), (2, -1), 16),
-                ('LEFTPADDING', (1, 0), (1, -1), 18),
-                ('RIGHTPADDING', (1, 0), (1, -1), 12),
-                ('LEFTPADDING', (2, 0), (2, -1), 12),
-                ('RIGHTPADDING', (2, 0), (2, -1), 18),
-            ]))
-            
-            # Use KeepTogether to ensure profit boxes stay on same page as costs table
-            # Include spacer to push profit boxes toward bottom
-            story.append(KeepTogether([two_col_table, Spacer(1, 0.5*inch), profit_table]))
-            
-            # Page break before Key Information section
-            story.append(PageBreak())
-            # No spacer needed - top margin already accounts for header
-            
-            # Key Information Section - Third Page Design (all content on one page)
-            # Collect all content first, then wrap in KeepTogether
-            key_info_content = []
-            
-            key_info_content.append(Paragraph("Key Information", section_title_style))
-            key_info_content.append(Spacer(1, STANDARD_SECTION_SPACING))
-            
-            # Property image (reduced size to fit on page) - always show, use placeholder if missing
-            img_width = 6.5*inch
-            img_height = 3.5*inch
-            main_img_path = None
-            
-            candidate_images = cover_images + property_gallery_images
-            if candidate_images:
-                try:
-                    for img_path in candidate_images:
-                        filename = os.path.basename(img_path).lower()
-                        if 'exterior' in filename and 'front' in filename:
-                            main_img_path = img_path
-                            break
-                    if not main_img_path:
-                        main_img_path = candidate_images[0]
-                    
-                    if main_img_path and os.path.exists(main_img_path):
-                        property_img_pil = Image.open(main_img_path)
-                        img_aspect = property_img_pil.width / property_img_pil.height
-                        img_width = 6.5*inch  # Slightly smaller to fit
-                        img_height = img_width / img_aspect
-                        if img_height > 3.5*inch:
-                            img_height = 3.5*inch
-                            img_width = img_height * img_aspect
-                        property_img = RLImage(main_img_path, width=img_width, height=img_height)
-                        key_info_content.append(property_img)
-                    else:
-                        placeholder = create_placeholder_drawing(img_width, img_height)
-                        key_info_content.append(placeholder)
-                    key_info_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
-                except Exception as e:
-                    print(f"Error loading property image: {e}")
-                    placeholder = create_placeholder_drawing(img_width, img_height)
-                    key_info_content.append(placeholder)
-                    key_info_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
-            else:
-                placeholder = create_placeholder_drawing(img_width, img_height)
-                key_info_content.append(placeholder)
-                key_info_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
-            
-            # Property Metrics - Four metrics displayed horizontally (label above value)
-            asking_price = data.get('asking_price', 'N/A')
-            if asking_price.startswith('£'):
-                asking_price_value = asking_price
-            else:
-                asking_price_value = f"£{asking_price.replace('£', '').strip()}"
-            
-            metrics_data = [
-                ['Asking price', 'Bedrooms', 'Size', 'On the market for'],
-                [asking_price_value, data.get('bedrooms', 'N/A'), 
-                 f"{data.get('size_sqm', 'N/A')} sqm", 
-                 f"{data.get('days_on_market', 'N/A')} days"]
-            ]
-            
-            metrics_table = Table(metrics_data, colWidths=[1.8*inch, 1.8*inch, 1.8*inch, 1.8*inch])
-            metrics_table.setStyle(TableStyle([
+            ]),
+            # Asking price, bedrooms, size and days on market
+            'key_metrics': TableStyle([
                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
                 ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica'),
                 ('FONTSIZE', (0, 0), (-1, 0), 11),
                 ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 1), (-1, 1), 16),
-                ('TOPPADDING', (0, 0), (-1, 0), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 4),
-                ('TOPPADDING', (0, 1), (-1, 1), 4),
-                ('BOTTOMPADDING', (0, 1), (-1, 1), 12),
+                ('LEADING', (0, 0), (-1, -1), TABLE_CELL_LEADING),
+                ('TOPPADDING', (0, 0), (-1, 0), KEY_METRIC_LABEL_PADDING[0]),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), KEY_METRIC_LABEL_PADDING[1]),
+                ('TOPPADDING', (0, 1), (-1, 1), KEY_METRIC_VALUE_PADDING[0]),
+                ('BOTTOMPADDING', (0, 1), (-1, 1), KEY_METRIC_VALUE_PADDING[1]),
                 ('LEFTPADDING', (0, 0), (-1, -1), 5),
                 ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-            ]))
-            key_info_content.append(metrics_table)
-            key_info_content.append(Spacer(1, STANDARD_TABLE_SPACING))
-            
-            # Key Features - Bulleted list
-            if data.get('key_features'):
-                # Split key features by newline and create bulleted list
-                features_text = data.get('key_features', '')
-                features_list = [f.strip() for f in features_text.split('\n') if f.strip()]
-                
-                key_info_content.append(Paragraph("Key Features", header_style))
-                key_info_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
-                
-                # Create bulleted list with reduced spacing to fit on page
-                for feature in features_list:
-                    bullet_para = Paragraph(f"• {feature}", 
-                        ParagraphStyle('KeyFeature', parent=styles['Normal'], 
-                                      fontSize=11, textColor=colors.black,
-                                      leftIndent=20, spaceAfter=5))  # Further reduced spacing
-                    key_info_content.append(bullet_para)
-            
-            # Use KeepTogether to ensure entire Key Information section stays on same page
-            story.append(KeepTogether(key_info_content))
-            
-            # Page break after Key Information page
-            story.append(PageBreak())
-            # No spacer needed - top margin already accounts for header
-            
-            # Other Key Information Page Header
-            other_key_content = []
-            other_key_content.append(Paragraph("Other Key Information", section_title_style))
-            other_key_content.append(Spacer(1, STANDARD_SECTION_SPACING))
-            
-            # Large Property Image below header - always show, use placeholder if missing
-            img_width = 7*inch
-            img_height = 3.5*inch
-            main_img_path = None
-            
-            candidate_images = cover_images + property_gallery_images
-            if candidate_images:
-                try:
-                    for img_path in candidate_images:
-                        filename = os.path.basename(img_path).lower()
-                        if 'exterior' in filename and 'front' in filename:
-                            main_img_path = img_path
-                            break
-                    if not main_img_path:
-                        main_img_path = candidate_images[0]
-                    
-                    if main_img_path and os.path.exists(main_img_path):
-                        property_img_pil = Image.open(main_img_path)
-                        img_aspect = property_img_pil.width / property_img_pil.height
-                        img_width = 7*inch  # Full width
-                        img_height = img_width / img_aspect
-                        if img_height > 3.3*inch:
-                            img_height = 3.3*inch
-                            img_width = img_height * img_aspect
-                        property_img = RLImage(main_img_path, width=img_width, height=img_height)
-                        other_key_content.append(property_img)
-                    else:
-                        placeholder = create_placeholder_drawing(img_width, img_height)
-                        other_key_content.append(placeholder)
-                except Exception as e:
-                    print(f"Error loading property image: {e}")
-                    placeholder = create_placeholder_drawing(img_width, img_height)
-                    other_key_content.append(placeholder)
-            else:
-                placeholder = create_placeholder_drawing(img_width, img_height)
-                other_key_content.append(placeholder)
-            
-            other_key_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
-            
-            # EPC Section - Horizontal Layout: Title (left) | Chart (middle) | Details (right)
-            epc_title_para = Paragraph("Energy Performance Certificate", 
-                ParagraphStyle('EPCTitle', parent=styles['Heading2'], fontSize=14, 
-                              textColor=colors.black, fontName='Helvetica-Bold'))
-            
-            epc_chart = self.create_epc_chart(data, primary_blue, accent_gold, success_green)
-            
-            epc_details_para = Paragraph(
-                f"<b>Latest available inspection date</b><br/>"
-                f"{data.get('inspection_date', 'N/A')}<br/><br/>"
-                f"<b>Window glazing</b><br/>"
-                f"{data.get('window_glazing', 'N/A')}<br/><br/>"
-                f"<b>Building construction age band</b><br/>"
-                f"{data.get('building_age', 'N/A')}",
-                ParagraphStyle('EPCDetails', parent=styles['Normal'], 
-                              fontSize=11, textColor=colors.black,
-                              leftIndent=0))
-            
-            epc_table = Table([[epc_title_para, epc_chart, epc_details_para]], 
-                             colWidths=[2*inch, 3.3*inch, 2.3*inch])
-            epc_table.setStyle(TableStyle([
+            ]),
+            # EPC title, chart and details side by side
+            'epc': TableStyle([
                 ('VALIGN', (0, 0), (-1, -1), 'TOP'),
                 ('ALIGN', (0, 0), (0, 0), 'LEFT'),
                 ('ALIGN', (1, 0), (1, 0), 'CENTER'),
@@ -1842,323 +1401,814 @@ class PDFBuilderApp:
                 ('TOPPADDING', (0, 0), (0, 0), 14),
                 ('TOPPADDING', (1, 0), (2, 0), 6),
                 ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ]))
-            other_key_content.append(epc_table)
-            other_key_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
+            ]),
+            # Broadband title spanning three speed columns
+            'broadband': TableStyle([
+                ('SPAN', (0, 0), (-1, 0)),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+                ('ALIGN', (0, 1), (-1, 1), 'LEFT'),
+                ('TOPPADDING', (0, 0), (-1, 0), 4),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+                ('TOPPADDING', (0, 1), (-1, 1), 4),
+                ('BOTTOMPADDING', (0, 1), (-1, 1), 6),
+            ]),
+            # Row of three city photos
+            'city': TableStyle([
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('TOPPADDING', (0, 0), (-1, -1), CITY_IMAGE_PADDING[0]),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), CITY_IMAGE_PADDING[1]),
+            ]),
+        }
+    
+    def _left_aligned_table(self, flowable, width):
+        """Wrap a flowable in a one-cell table pinned to the top-left of the frame"""
+        from reportlab.platypus import Table
+        row_height = table_row_height(DEFAULT_CELL_PADDING, flowable.height)
+        table = Table([[flowable]], colWidths=[width], rowHeights=[row_height])
+        table.setStyle(self._table_styles['left_aligned'])
+        return table
+    
+    def _canonical_image_path(self, path):
+        """Map identical image files onto a single path so each is embedded once per PDF"""
+        try:
+            key = file_content_hash(path)
+        except OSError:
+            return path
+        return self._image_cache.setdefault(key, path)
+    
+    def _prepared_image_source(self, path):
+        """Return the path of a downscaled JPEG for oversized photos, or the path itself.
+        
+        Downscaled copies live on disk so ReportLab embeds them straight from the file
+        without decoding pixels or holding them in memory during the build.
+        """
+        try:
+            key = file_content_hash(path)
+        except OSError:
+            return path
+        recompress = self._recompress_images
+        prepared_images = self._recompressed_images if recompress else self._prepared_images
+        if key not in prepared_images:
+            prepared_images[key] = None
+            try:
+                prepared = prepare_image_for_pdf(path, recompress=recompress)
+                if prepared:
+                    if self._prepared_dir is None:
+                        self._prepared_dir = tempfile.TemporaryDirectory(prefix="property_pdf_")
+                    suffix = "-recompressed" if recompress else ""
+                    prepared_path = os.path.join(self._prepared_dir.name, f"{key}{suffix}.jpg")
+                    with open(prepared_path, 'wb') as f:
+                        f.write(prepared)
+                    prepared_images[key] = prepared_path
+            except Exception as exc:
+                print(f"Unable to downscale {path}: {exc}")
+        return prepared_images[key] or path
+    
+    def _prepare_report_images(self, images_by_section):
+        """Downscale every oversized photo in the report up front, several files at a time"""
+        paths = {
+            self._canonical_image_path(path)
+            for section_paths in images_by_section.values()
+            for path in section_paths
+            if path and os.path.exists(path)
+        }
+        self._recompress_images = sum(os.path.getsize(path) for path in paths) > RECOMPRESS_REPORT_BYTES
+        if len(paths) < 2:
+            return
+        # Created here so worker threads never race to create it
+        if self._prepared_dir is None:
+            self._prepared_dir = tempfile.TemporaryDirectory(prefix="property_pdf_")
+        # Pillow releases the GIL while decoding, resizing and encoding, so threads use
+        # every core without re-importing the app in worker processes. Capped so large
+        # machines do not hold dozens of decoded photos in memory at once.
+        workers = min(len(paths), MAX_IMAGE_PREP_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._prepared_image_source, paths))
+    
+    @cached_property
+    def _logo_exists(self):
+        """Whether the bundled logo is present, checked once instead of on every page"""
+        return os.path.exists(self.logo_path)
+    
+    @cached_property
+    def _logo_reader(self):
+        """Header logo decoded once and reused as a single XObject on every page"""
+        from reportlab.lib.utils import ImageReader
+        return ImageReader(self.logo_path)
+    
+    def _canvas_image_source(self, path):
+        """Return the file canvas.drawImage should use to reuse the matching image flowable's XObject"""
+        return self._prepared_image_source(self._canonical_image_path(path))
+    
+    def _image_aspect(self, path):
+        """Width/height ratio of an image, read from its header once per PDF"""
+        from report_flowables import image_aspect_ratio
+        key = self._canonical_image_path(path)
+        aspect = self._image_aspects.get(key)
+        if aspect is None:
+            aspect = self._image_aspects[key] = image_aspect_ratio(key)
+        return aspect
+    
+    def _get_image(self, path, width, height, aspect=None):
+        """Create an image flowable that shares its embedded XObject with identical files.
+        
+        Pass the aspect ratio when the caller has already read the image header, so the
+        flowable does not open the file again just to validate it.
+        """
+        from report_flowables import FileImage
+        return FileImage(self._canvas_image_source(path), width, height, aspect=aspect)
+    
+    def _fitted_main_image(self, path, aspect, max_width, max_height, placeholder_height, image_errors):
+        """Main property photo scaled to fit the given box, or a placeholder when it is unusable"""
+        from report_flowables import create_placeholder_drawing
+        if aspect:
+            img_width = max_width
+            img_height = img_width / aspect
+            if img_height > max_height:
+                img_height = max_height
+                img_width = img_height * aspect
+            try:
+                return self._get_image(path, img_width, img_height, aspect=aspect)
+            except Exception as e:
+                image_errors.append((path, e))
+        return create_placeholder_drawing(max_width, placeholder_height)
+    
+    def generate_pdf(self):
+        """Generate the comprehensive investment report PDF with professional styling"""
+        try:
+            # Get all form data
+            data = {field_name: self._get_widget_value(field_name) for field_name in FORM_FIELDS}
             
-            disclaimer_para = Paragraph(
-                "This EPC data is accurate up to 6 months ago. If a more recent EPC assessment was done within this period, it will not be displayed here.",
-                ParagraphStyle('EPCDisclaimer', parent=styles['Normal'], 
-                              fontSize=9, textColor=HexColor('#666666')))
-            other_key_content.append(disclaimer_para)
-            other_key_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
+            # Check if we have at least an address
+            if not data.get('address'):
+                messagebox.showerror("Error", "Please enter at least the property address.")
+                return
             
-            if data.get('broadband_available'):
-                broadband_title_para = Paragraph("Internet / Broadband Availability", 
-                    ParagraphStyle('BroadbandTitle', parent=styles['Heading2'], fontSize=14, 
-                                  textColor=colors.black, fontName='Helvetica-Bold'))
-                
-                broadband_item1 = Paragraph(
-                    f"Broadband available<br/><b>{data.get('broadband_available', 'N/A')}</b>",
-                    ParagraphStyle('BroadbandItem', parent=styles['Normal'], 
-                                  fontSize=11, textColor=colors.black))
-                
-                broadband_item2 = Paragraph(
-                    f"Highest available download speed<br/><b>{data.get('download_speed', 'N/A')}</b>",
-                    ParagraphStyle('BroadbandItem', parent=styles['Normal'], 
-                                  fontSize=11, textColor=colors.black))
-                
-                broadband_item3 = Paragraph(
-                    f"Highest available upload speed<br/><b>{data.get('upload_speed', 'N/A')}</b>",
-                    ParagraphStyle('BroadbandItem', parent=styles['Normal'], 
-                                  fontSize=11, textColor=colors.black))
-                
-                broadband_table = Table([
-                    [broadband_title_para, '', ''],
-                    [broadband_item1, broadband_item2, broadband_item3]
-                ], colWidths=[2.3*inch, 2.3*inch, 2.4*inch])
-                broadband_table.setStyle(TableStyle([
-                    ('SPAN', (0, 0), (-1, 0)),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                    ('ALIGN', (0, 1), (-1, 1), 'LEFT'),
-                    ('TOPPADDING', (0, 0), (-1, 0), 4),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('TOPPADDING', (0, 1), (-1, 1), 4),
-                    ('BOTTOMPADDING', (0, 1), (-1, 1), 6),
-                ]))
-                other_key_content.append(broadband_table)
+            # Ask for output file location
+            default_filename = f"{data.get('address', 'Property')} - Investment Report.pdf"
+            file_path = filedialog.asksaveasfilename(
+                title="Save Investment Report As",
+                defaultextension=".pdf",
+                filetypes=[("PDF files", "*.pdf")],
+                initialfile=default_filename
+            )
             
-            story.append(KeepTogether(other_key_content))
+            if not file_path:
+                return
             
-            # Floor Plans Section - always show at least one placeholder if no floor plans
-            floor_plan_queue = floor_plan_images if floor_plan_images else [None]
+            # Snapshot the image lists so edits during the build cannot race the worker
+            images_by_section = {key: list(paths) for key, paths in self.image_sections.items()}
+        except Exception as e:
+            print(f"Error generating PDF: {e}")
+            messagebox.showerror("Error", f"Error generating PDF: {str(e)}")
+            return
+        
+        self._set_generating(True)
+        self._pdf_progress_queue = queue.Queue()
+        threading.Thread(
+            target=self._build_pdf_worker,
+            args=(file_path, data, images_by_section, self._pdf_progress_queue),
+            daemon=True
+        ).start()
+        self.root.after(50, self._poll_pdf_progress)
+    
+    def _build_pdf_worker(self, file_path, data, images_by_section, progress_queue):
+        """Build the PDF off the Tk main thread; results are reported through the queue"""
+        def report_progress(kind, value):
+            if kind in ('SIZE_EST', 'PROGRESS'):
+                progress_queue.put((kind, value))
+        try:
+            self._build_pdf(file_path, data, images_by_section, report_progress)
+            progress_queue.put(('DONE', file_path))
+        except Exception as e:
+            print(f"Error generating PDF: {e}")
+            progress_queue.put(('ERROR', str(e)))
+    
+    def _poll_pdf_progress(self):
+        """Drain worker progress messages on the Tk main thread"""
+        while True:
+            try:
+                kind, value = self._pdf_progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'SIZE_EST':
+                self.progress_bar.configure(maximum=max(value, 1), value=0)
+            elif kind == 'PROGRESS':
+                self.progress_bar.configure(value=value)
+            elif kind == 'DONE':
+                self._set_generating(False)
+                print(f"PDF saved: {value}")
+                return
+            elif kind == 'ERROR':
+                self._set_generating(False)
+                messagebox.showerror("Error", f"Error generating PDF: {value}")
+                return
+        self.root.after(50, self._poll_pdf_progress)
+    
+    def _set_generating(self, generating):
+        """Toggle the generate button and progress bar while a PDF is being built"""
+        if generating:
+            self.generate_button.state(['disabled'])
+            self.progress_bar.configure(value=0)
+            self.progress_bar.pack(side=tk.LEFT, padx=(0, 12))
+        else:
+            self.generate_button.state(['!disabled'])
+            self.progress_bar.pack_forget()
+    
+    def _build_pdf(self, file_path, data, images_by_section, progress_callback=None):
+        """Build the investment report PDF at file_path from form data and image sections"""
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether
+        from report_flowables import (
+            PRIMARY_BLUE, ACCENT_GOLD, SUCCESS_GREEN, RULE_GREY, create_placeholder_drawing
+        )
+        print(f"Generating PDF: {file_path}")
+        self._image_cache = {}
+        self._image_aspects = {}
+        self._prepare_report_images(images_by_section)
+        
+        # Calculate exact header height for consistent spacing (before creating doc)
+        # Use the same HEADER_TOP_OFFSET constant for consistency
+        # Header positioning:
+        #   - Logo top: HEADER_TOP_OFFSET from page top (0.45")
+        #   - Logo height: get actual height from logo image for accuracy
+        #   - Tagline spacing: 12 points below logo bottom
+        #   - Tagline font: 9pt, with ~2pt margin for text height
+        #   - Content spacing: 0 below tagline bottom (content starts immediately)
+        TAGLINE_SPACING_POINTS = 12  # Points between logo bottom and tagline baseline
+        TAGLINE_FONT_SIZE = 9  # Tagline font size in points
+        TAGLINE_TEXT_MARGIN = 2  # Additional points for text height below baseline
+        TAGLINE_TOTAL_HEIGHT = (TAGLINE_SPACING_POINTS + TAGLINE_FONT_SIZE + TAGLINE_TEXT_MARGIN) / 72.0 * inch  # Convert to inches
+        HEADER_TO_CONTENT_SPACING = 0  # No space from tagline bottom to first content - content starts immediately
+        
+        # Get actual logo height for accurate top margin calculation
+        logo_width = 1.4 * inch  # Standard logo width
+        LOGO_ACTUAL_HEIGHT = 0.6*inch  # Default fallback
+        if self._logo_exists:
+            try:
+                img_width, img_height = self._logo_reader.getSize()
+                if img_width and img_height:
+                    LOGO_ACTUAL_HEIGHT = logo_width * (img_height / img_width)
+            except Exception:
+                pass  # Use default if can't read logo
+        
+        # Total: top offset + actual logo height + tagline (no content spacing)
+        REQUIRED_TOP_MARGIN = self.HEADER_TOP_OFFSET + LOGO_ACTUAL_HEIGHT + TAGLINE_TOTAL_HEIGHT + HEADER_TO_CONTENT_SPACING
+        
+        # Create PDF document with custom margins
+        doc = SimpleDocTemplate(
+            file_path,
+            pagesize=A4,
+            leftMargin=0.75*inch,
+            rightMargin=0.75*inch,
+            topMargin=REQUIRED_TOP_MARGIN,
+            bottomMargin=0.75*inch
+        )
+        story = []
+        
+        cover_images = list(images_by_section.get('cover', []))
+        property_gallery_images = list(images_by_section.get('property', []))
+        floor_plan_images = list(images_by_section.get('floor_plans', []))
+        directions_images = list(images_by_section.get('directions', []))
+        city_images = list(images_by_section.get('city', []))
+        
+        # Define professional color scheme
+        primary_blue = PRIMARY_BLUE
+        accent_gold = ACCENT_GOLD
+        success_green = SUCCESS_GREEN
+        
+        # Standard spacing constants for consistency
+        STANDARD_SECTION_SPACING = 20  # Space after section title (points)
+        STANDARD_IMAGE_SPACING = 20  # Space after images (points)
+        STANDARD_TABLE_SPACING = 20  # Space after tables (points)
+        STANDARD_CONTENT_SPACING = 12  # Space between content elements (points)
+        
+        # Styles are built once per app instance
+        styles = self._paragraph_styles
+        table_styles = self._table_styles
+        # Images that fall back to placeholders, reported together once the story is built
+        image_errors = []
+        header_style = styles['header']
+        body_style = styles['body']
+        highlight_style = styles['highlight']
+        section_title_style = styles['section_title']
+        
+        # Create cover page (first page)
+        cover_page = self.create_cover_page(data, accent_gold, primary_blue, images_by_section)
+        if cover_page:
+            story.extend([cover_page, PageBreak()])
+            # No spacer needed - top margin already accounts for header
+        
+        # Investment Opportunity Section - Second Page Design
+        story.extend([Paragraph("Investment Opportunity", section_title_style), Spacer(1, STANDARD_SECTION_SPACING)])
+        
+        # Form values are read many times below; bind the lookup once
+        get = data.get
+        fields = defaultdict(lambda: 'N/A', data)
+        
+        # Calculate investment metrics
+        purchase_price = parse_money(get('purchase_price'))
+        deposit_percent = parse_money(get('deposit_percent'), 20.0)
+        monthly_rent = parse_money(get('monthly_rent'))
+        mortgage_rate = parse_money(get('mortgage_rate'), 5.8)
+        
+        # Calculate costs
+        stamp_duty, survey_cost, legal_fees, loan_setup = (
+            parse_money(get(field)) for field in PURCHASE_COST_FIELDS
+        )
+        council_tax, repairs, utilities, water, broadband, insurance = (
+            parse_money(get(field)) for field in ANNUAL_EXPENSE_FIELDS
+        )
+        
+        deposit_amount = purchase_price * (deposit_percent / 100)
+        annual_rent = monthly_rent * 12
+        total_purchase_costs = stamp_duty + survey_cost + legal_fees + loan_setup
+        total_investment = deposit_amount + total_purchase_costs
+        
+        # Calculate expenses
+        mortgage_amount = purchase_price - deposit_amount
+        annual_mortgage_interest = mortgage_amount * (mortgage_rate / 100)
+        total_annual_expenses = annual_mortgage_interest + council_tax + repairs + utilities + water + broadband + insurance
+        annual_profit = annual_rent - total_annual_expenses
+        monthly_profit = annual_profit / 12
+        
+        # Ratios default to zero when there is nothing to divide by
+        rental_yield = (annual_rent / purchase_price) * 100 if purchase_price else 0
+        roi = (annual_profit / total_investment) * 100 if total_investment else 0
+        
+        # Three Key Metrics Boxes (horizontal gold boxes) - individual boxes, bigger
+        box_width = 2.4*inch
+        box_spacing = 0.15*inch  # Space between boxes
+        
+        # Create three individual boxes side by side with spacing
+        # Text tables below get explicit row heights so ReportLab skips measuring every cell:
+        # each is one line at TABLE_CELL_LEADING plus the padding its style uses
+        metrics_table = Table([
+            ['Purchase Price', '', 'Estimated Monthly Rent', '', 'Rental Yield'],
+            [format_money(purchase_price), '', format_money(monthly_rent) + "pcm", '', f"{rental_yield:.1f}%"]
+        ], colWidths=[box_width, box_spacing, box_width, box_spacing, box_width],
+           rowHeights=[table_row_height(PRICE_LABEL_PADDING), table_row_height(PRICE_VALUE_PADDING)])
+        metrics_table.setStyle(table_styles['price_metrics'])
+        story.extend([metrics_table, Spacer(1, STANDARD_TABLE_SPACING)])
+        
+        # Two Column Layout for Costs and Expenses
+        # Left Column: Total Purchase Costs
+        purchase_costs_data = [
+            ['Total Purchase Costs', ''],
+            ['Deposit(20%)', format_money(deposit_amount)],
+            ['Stamp Duty', format_money(stamp_duty)],
+            ['Survey', format_money(survey_cost)],
+            ['Legal Fees', format_money(legal_fees)],
+            ['Loan Set-up', format_money(loan_setup)],
+            ['Total Investment Required', format_money(total_investment)]
+        ]
+        
+        # Right Column: Total Annual Expenses
+        expenses_data = [
+            ['Total Annual Expenses', ''],
+            [f'Mortgage @ {mortgage_rate}% (Interest Only)', format_money(annual_mortgage_interest)],
+            ['Council Tax', format_money(council_tax)],
+            ['Repairs / Maintenance', format_money(repairs)],
+            ['Electric / Gas', format_money(utilities)],
+            ['Water', format_money(water)],
+            ['Broadband / TV', format_money(broadband)],
+            ['Insurance', format_money(insurance)],
+            ['Total', format_money(total_annual_expenses)]
+        ]
+        
+        # Create two-column table
+        two_col_data = []
+        max_rows = max(len(purchase_costs_data), len(expenses_data))
+        for i in range(max_rows):
+            left_col = purchase_costs_data[i] if i < len(purchase_costs_data) else ['', '']
+            right_col = expenses_data[i] if i < len(expenses_data) else ['', '']
+            two_col_data.append([left_col[0], left_col[1], right_col[0], right_col[1]])
+        
+        # Keep the column headings on both halves if a long cost list ever splits across pages
+        two_col_table = Table(two_col_data, colWidths=[2.2*inch, 1.3*inch, 2.2*inch, 1.3*inch],
+                              rowHeights=[table_row_height(TWO_COLUMN_PADDING)] * len(two_col_data), repeatRows=1)
+        
+        # Add horizontal lines between all rows (light grey lines), one range per column pair
+        two_col_table.setStyle(TableStyle([
+            ('LINEBELOW', (0, 1), (1, -1), 0.5, RULE_GREY),
+            ('LINEBELOW', (2, 1), (3, -1), 0.5, RULE_GREY),
+        ], parent=table_styles['two_column']))
+        
+        # Three Vertical Boxes for Profit/ROI (positioned at bottom right, bigger)
+        # Create table with left column empty and boxes on the right
+        profit_table = Table([
+            ['', 'Monthly Profit', format_money(monthly_profit)],
+            ['', 'Annual Profit', format_money(annual_profit)],
+            ['', 'ROI', f"{roi:.1f}%"]
+        ], colWidths=[3.5*inch, 2*inch, 2*inch], rowHeights=[table_row_height(PROFIT_BOX_PADDING)] * 3)
+        profit_table.setStyle(table_styles['profit'])
+        
+        # Use KeepTogether to ensure profit boxes stay on same page as costs table
+        # Include spacer to push profit boxes toward bottom
+        story.append(KeepTogether([two_col_table, Spacer(1, 0.5*inch), profit_table]))
+        
+        # Page break before Key Information section
+        story.append(PageBreak())
+        # No spacer needed - top margin already accounts for header
+        
+        # Key Information Section - Third Page Design (all content on one page)
+        # Collect all content first, then wrap in KeepTogether
+        key_info_content = []
+        
+        key_info_content.append(Paragraph("Key Information", section_title_style))
+        key_info_content.append(Spacer(1, STANDARD_SECTION_SPACING))
+        
+        # Property image (reduced size to fit on page) - always show, use placeholder if missing
+        # The same photo heads the next page too, so pick it and read its size only once
+        main_img_path = None
+        main_img_aspect = None
+        candidate_images = cover_images + property_gallery_images
+        if candidate_images:
+            main_img_path = next(
+                (img_path for img_path in candidate_images
+                 if 'exterior' in os.path.basename(img_path).lower()
+                 and 'front' in os.path.basename(img_path).lower()),
+                candidate_images[0]
+            )
+            if os.path.exists(main_img_path):
+                try:
+                    main_img_aspect = self._image_aspect(main_img_path)
+                except Exception as e:
+                    image_errors.append((main_img_path, e))
+        
+        key_info_content.append(self._fitted_main_image(
+            main_img_path, main_img_aspect, 6.5*inch, 3.5*inch, 3.5*inch, image_errors
+        ))
+        key_info_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
+        
+        # Property Metrics - Four metrics displayed horizontally (label above value)
+        asking_price = get('asking_price', 'N/A')
+        if asking_price.startswith('£'):
+            asking_price_value = asking_price
+        else:
+            asking_price_value = f"£{asking_price.replace('£', '').strip()}"
+        
+        metrics_data = (
+            ('Asking price', 'Bedrooms', 'Size', 'On the market for'),
+            (asking_price_value, get('bedrooms', 'N/A'), 
+             f"{get('size_sqm', 'N/A')} sqm", 
+             f"{get('days_on_market', 'N/A')} days"),
+        )
+        
+        metrics_table = Table(metrics_data, colWidths=[1.8*inch, 1.8*inch, 1.8*inch, 1.8*inch],
+                              rowHeights=[table_row_height(KEY_METRIC_LABEL_PADDING),
+                                          table_row_height(KEY_METRIC_VALUE_PADDING)])
+        metrics_table.setStyle(table_styles['key_metrics'])
+        key_info_content.append(metrics_table)
+        key_info_content.append(Spacer(1, STANDARD_TABLE_SPACING))
+        
+        # Key Features - Bulleted list
+        if get('key_features'):
+            # Split key features by newline and create bulleted list
+            features_text = get('key_features', '')
+            features_list = [f.strip() for f in features_text.split('\n') if f.strip()]
             
-            if floor_plan_queue:
-                story.append(PageBreak())
-                # No spacer needed - top margin already accounts for header
-                
-                story.append(Paragraph("Floor Plans", section_title_style))
-                story.append(Spacer(1, STANDARD_SECTION_SPACING))
+            key_info_content.append(Paragraph("Key Features", header_style))
+            key_info_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
+            
+            # Create bulleted list with reduced spacing to fit on page
+            for feature in features_list:
+                bullet_para = Paragraph(f"• {feature}", styles['key_feature'])
+                key_info_content.append(bullet_para)
+        
+        # Use KeepTogether to ensure entire Key Information section stays on same page
+        story.append(KeepTogether(key_info_content))
+        
+        # Page break after Key Information page
+        story.append(PageBreak())
+        # No spacer needed - top margin already accounts for header
+        
+        # Other Key Information Page Header
+        other_key_content = []
+        other_key_content.append(Paragraph("Other Key Information", section_title_style))
+        other_key_content.append(Spacer(1, STANDARD_SECTION_SPACING))
+        
+        # Large Property Image below header - always show, use placeholder if missing
+        other_key_content.append(self._fitted_main_image(
+            main_img_path, main_img_aspect, 7*inch, 3.3*inch, 3.5*inch, image_errors
+        ))
+        
+        other_key_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
+        
+        # EPC Section - Horizontal Layout: Title (left) | Chart (middle) | Details (right)
+        epc_title_para = Paragraph("Energy Performance Certificate", styles['epc_title'])
+        
+        epc_chart = self.create_epc_chart(data, primary_blue, accent_gold, success_green)
+        
+        epc_details_para = Paragraph(EPC_DETAILS_TEMPLATE.format_map(fields), styles['epc_details'])
+        
+        epc_table = Table([[epc_title_para, epc_chart, epc_details_para]], 
+                         colWidths=[2*inch, 3.3*inch, 2.3*inch])
+        epc_table.setStyle(table_styles['epc'])
+        other_key_content.append(epc_table)
+        other_key_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
+        
+        disclaimer_para = Paragraph(
+            "This EPC data is accurate up to 6 months ago. If a more recent EPC assessment was done within this period, it will not be displayed here.",
+            styles['epc_disclaimer'])
+        other_key_content.append(disclaimer_para)
+        other_key_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
+        
+        if get('broadband_available'):
+            broadband_title_para = Paragraph("Internet / Broadband Availability", styles['broadband_title'])
+            
+            broadband_items = [
+                Paragraph(template.format_map(fields), styles['broadband_item'])
+                for template in BROADBAND_ITEM_TEMPLATES
+            ]
+            
+            broadband_table = Table([
+                [broadband_title_para, '', ''],
+                broadband_items
+            ], colWidths=[2.3*inch, 2.3*inch, 2.4*inch])
+            broadband_table.setStyle(table_styles['broadband'])
+            other_key_content.append(broadband_table)
+        
+        story.append(KeepTogether(other_key_content))
+        
+        # Floor Plans Section - always show at least one placeholder if no floor plans
+        floor_plan_queue = floor_plan_images if floor_plan_images else [None]
+        
+        if floor_plan_queue:
+            story.append(PageBreak())
+            # No spacer needed - top margin already accounts for header
+            
+            story.extend([Paragraph("Floor Plans", section_title_style), Spacer(1, STANDARD_SECTION_SPACING)])
+            
+            for i, image_path in enumerate(floor_plan_queue):
+                # For subsequent floor plans, add page break (but not for the first one, since we already added it)
+                if i > 0:
+                    story.append(PageBreak())
+                    # No spacer needed - top margin already accounts for header
                 
-                for i, image_path in enumerate(floor_plan_queue):
-                    # For subsequent floor plans, add page break (but not for the first one, since we already added it)
-                    if i > 0:
-                        story.append(PageBreak())
-                        # No spacer needed - top margin already accounts for header
+                if image_path is None:
+                    # Use placeholder
+                    img_width = 6.5*inch
+                    img_height = 4.5*inch
+                    placeholder = create_placeholder_drawing(img_width, img_height)
                     
-                    if image_path is None:
-                        # Use placeholder
-                        img_width = 6.5*inch
-                        img_height = 4.5*inch
-                        placeholder = create_placeholder_drawing(img_width, img_height)
-                        
-                        # Align to top-left like other images (no vertical centering)
-                        # No spacer needed - image starts immediately after section spacing
-                        
-                        # Align to left (not centered)
-                        left_table = Table([[placeholder]], colWidths=[img_width])
-                        left_table.setStyle(TableStyle([
-                            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                            ('VALIGN', (0, 0), (0, 0), 'TOP'),
-                        ]))
-                        story.append(left_table)
-                    else:
-                        try:
-                            # Load image to get dimensions
-                            if os.path.exists(image_path):
-                                img_pil = Image.open(image_path)
-                                img_aspect = img_pil.width / img_pil.height
-                                
-                                # Display floor plan images - larger size for better visibility
-                                img_width = 6.5*inch
-                                img_height = img_width / img_aspect
-                                
-                                # Limit height to ensure it fits on page
-                                if img_height > 4.5*inch:
-                                    img_height = 4.5*inch
-                                    img_width = img_height * img_aspect
-                                
-                                img = RLImage(image_path, width=img_width, height=img_height)
-                            else:
-                                # Use placeholder if file doesn't exist
-                                img_width = 6.5*inch
-                                img_height = 4.5*inch
-                                img = create_placeholder_drawing(img_width, img_height)
+                    # Align to top-left like other images (no vertical centering)
+                    # No spacer needed - image starts immediately after section spacing
+                    
+                    # Align to left (not centered)
+                    story.append(self._left_aligned_table(placeholder, img_width))
+                else:
+                    try:
+                        # Load image to get dimensions
+                        if os.path.exists(image_path):
+                            img_aspect = self._image_aspect(image_path)
                             
-                            # Align image to top-left like other images (no centering)
-                            # No spacer needed - image starts immediately after section spacing
+                            # Display floor plan images - larger size for better visibility
+                            img_width = 6.5*inch
+                            img_height = img_width / img_aspect
                             
-                            # Align to left (not centered) using Table
-                            left_table = Table([[img]], colWidths=[img_width])
-                            left_table.setStyle(TableStyle([
-                                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                                ('VALIGN', (0, 0), (0, 0), 'TOP'),
-                            ]))
-                            story.append(left_table)
+                            # Limit height to ensure it fits on page
+                            if img_height > 4.5*inch:
+                                img_height = 4.5*inch
+                                img_width = img_height * img_aspect
                             
-                        except Exception as e:
-                            print(f"Error adding floor plan image {image_path}: {e}")
-                            # Use placeholder on error
+                            img = self._get_image(image_path, img_width, img_height, aspect=img_aspect)
+                        else:
+                            # Use placeholder if file doesn't exist
                             img_width = 6.5*inch
                             img_height = 4.5*inch
-                            placeholder = create_placeholder_drawing(img_width, img_height)
-                            # Align to top-left like other images (no centering)
-                            left_table = Table([[placeholder]], colWidths=[img_width])
-                            left_table.setStyle(TableStyle([
-                                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                                ('VALIGN', (0, 0), (0, 0), 'TOP'),
-                            ]))
-                            story.append(left_table)
-            
-            # Property Images Gallery - defaults to cover images if gallery is empty
-            regular_images = list(property_gallery_images)
-            if not regular_images:
-                regular_images = list(cover_images)
-            if not regular_images:
-                regular_images = [None]  # Use None as placeholder marker
+                            img = create_placeholder_drawing(img_width, img_height)
+                        
+                        # Align image to top-left like other images (no centering)
+                        # No spacer needed - image starts immediately after section spacing
+                        
+                        # Align to left (not centered) using Table
+                        story.append(self._left_aligned_table(img, img_width))
+                        
+                    except Exception as e:
+                        image_errors.append((image_path, e))
+                        # Use placeholder on error
+                        img_width = 6.5*inch
+                        img_height = 4.5*inch
+                        placeholder = create_placeholder_drawing(img_width, img_height)
+                        # Align to top-left like other images (no centering)
+                        story.append(self._left_aligned_table(placeholder, img_width))
+        
+        # Property Images Gallery - defaults to cover images if gallery is empty
+        regular_images = list(property_gallery_images)
+        if not regular_images:
+            regular_images = list(cover_images)
+        if not regular_images:
+            regular_images = [None]  # Use None as placeholder marker
+        
+        if regular_images:
+            story.append(PageBreak())
+            # No spacer needed - top margin already accounts for header
+            story.extend([Paragraph("Property Images", section_title_style), Spacer(1, STANDARD_SECTION_SPACING)])
             
-            if regular_images:
-                story.append(PageBreak())
-                # No spacer needed - top margin already accounts for header
-                story.append(Paragraph("Property Images", section_title_style))
-                story.append(Spacer(1, STANDARD_SECTION_SPACING))
+            image_blocks = []
+            for i, image_path in enumerate(regular_images):
+                caption_text = f"Image {i+1}: Placeholder"
                 
-                image_blocks = []
-                for i, image_path in enumerate(regular_images):
-                    caption_text = f"Image {i+1}: Placeholder"
-                    
-                    if image_path is None:
-                        img_flowable = create_placeholder_drawing(6*inch, 3.5*inch)
-                    else:
-                        try:
-                            if os.path.exists(image_path):
-                                img_flowable = RLImage(image_path, width=6*inch, height=3.5*inch)
-                                caption_text = f"Image {i+1}: {os.path.basename(image_path)}"
-                            else:
-                                img_flowable = create_placeholder_drawing(6*inch, 3.5*inch)
-                                caption_text = f"Image {i+1}: File not found"
-                        except Exception as e:
-                            print(f"Error adding image {image_path}: {e}")
+                if image_path is None:
+                    img_flowable = create_placeholder_drawing(6*inch, 3.5*inch)
+                else:
+                    try:
+                        if os.path.exists(image_path):
+                            img_flowable = self._get_image(image_path, 6*inch, 3.5*inch)
+                            caption_text = f"Image {i+1}: {os.path.basename(image_path)}"
+                        else:
                             img_flowable = create_placeholder_drawing(6*inch, 3.5*inch)
-                            caption_text = f"Image {i+1}: Error loading image"
-                    
-                    block_elements = [
-                        Spacer(1, STANDARD_IMAGE_SPACING if i == 0 else STANDARD_CONTENT_SPACING),
-                        img_flowable,
-                        Spacer(1, STANDARD_CONTENT_SPACING),
-                        Paragraph(caption_text, body_style),
-                        Spacer(1, STANDARD_CONTENT_SPACING),
-                    ]
-                    image_blocks.append(block_elements)
+                            caption_text = f"Image {i+1}: File not found"
+                    except Exception as e:
+                        image_errors.append((image_path, e))
+                        img_flowable = create_placeholder_drawing(6*inch, 3.5*inch)
+                        caption_text = f"Image {i+1}: Error loading image"
                 
-                for block in image_blocks:
-                    story.append(KeepTogether(block))
-            
-            # Getting To The City Centre and About the City (Last Page)
-            story.append(PageBreak())
-            # No spacer needed - top margin already accounts for header
-            
-            # Location Information - Logo, Title, and Directions Image
-            story.append(Paragraph("Getting To The City Centre", section_title_style))
-            story.append(Spacer(1, STANDARD_SECTION_SPACING))
-            
-            # Directions Image
-            directions_image_path = next(iter(directions_images), None)
-            
-            # If not found in images list, check sample_images folder
-            if not directions_image_path:
-                sample_paths = [
-                    get_resource_path("sample_images/directions.png"),
-                    get_resource_path("directions.png"),
-                    get_resource_path("sample_images/directions.jpg"),
-                    get_resource_path("directions.jpg")
+                block_elements = [
+                    Spacer(1, STANDARD_IMAGE_SPACING if i == 0 else STANDARD_CONTENT_SPACING),
+                    img_flowable,
+                    Spacer(1, STANDARD_CONTENT_SPACING),
+                    Paragraph(caption_text, body_style),
+                    Spacer(1, STANDARD_CONTENT_SPACING),
                 ]
-                for path in sample_paths:
-                    if os.path.exists(path):
-                        directions_image_path = path
-                        break
+                image_blocks.append(block_elements)
             
-            # Always show directions image (placeholder if not found)
-            if directions_image_path and os.path.exists(directions_image_path):
+            story.extend(KeepTogether(block) for block in image_blocks)
+        
+        # Getting To The City Centre and About the City (Last Page)
+        story.append(PageBreak())
+        # No spacer needed - top margin already accounts for header
+        
+        # Location Information - Logo, Title, and Directions Image
+        story.extend([Paragraph("Getting To The City Centre", section_title_style), Spacer(1, STANDARD_SECTION_SPACING)])
+        
+        # Directions Image
+        directions_image_path = next(iter(directions_images), None)
+        
+        # If not found in images list, check sample_images folder
+        if not directions_image_path:
+            sample_paths = [
+                get_resource_path("sample_images/directions.png"),
+                get_resource_path("directions.png"),
+                get_resource_path("sample_images/directions.jpg"),
+                get_resource_path("directions.jpg")
+            ]
+            for path in sample_paths:
+                if os.path.exists(path):
+                    directions_image_path = path
+                    break
+        
+        # Always show directions image (placeholder if not found)
+        if directions_image_path and os.path.exists(directions_image_path):
+            try:
+                # Load image to get dimensions
+                img_aspect = self._image_aspect(directions_image_path)
+                
+                # Display directions image - full width
+                img_width = 7*inch
+                img_height = img_width / img_aspect
+                
+                # Limit height to ensure it fits on page
+                if img_height > 8*inch:
+                    img_height = 8*inch
+                    img_width = img_height * img_aspect
+                
+                directions_img = self._get_image(directions_image_path, img_width, img_height, aspect=img_aspect)
+                story.append(directions_img)
+            except Exception as e:
+                image_errors.append((directions_image_path, e))
+                # Use placeholder on error
+                placeholder = create_placeholder_drawing(7*inch, 4.5*inch)
+                story.append(placeholder)
+        else:
+            # Use placeholder if not found
+                placeholder = create_placeholder_drawing(7*inch, 4.5*inch)
+                story.append(placeholder)
+        
+        story.append(Spacer(1, STANDARD_IMAGE_SPACING))
+        
+        # About the City and City Images - keep together on same page
+        about_city_content = []
+        
+        # About the City
+        if get('about_city'):
+            about_city_content.append(Paragraph("About the City", header_style))
+            about_city_content.append(Paragraph(f"<b>{get('city', 'N/A')}</b>", highlight_style))
+            about_city_content.append(Paragraph(get('about_city'), body_style))
+            about_city_content.append(Paragraph(f"<b>Population:</b> {get('population', 'N/A')}", body_style))
+            about_city_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
+        
+        # City Images Section
+        city_queue = list(city_images)
+        
+        # If not provided, fall back to bundled sample images
+        if not city_queue:
+            sample_paths = [
+                get_resource_path("sample_images/liverpool1.jpg"),
+                get_resource_path("sample_images/liverpool2.jpg"),
+                get_resource_path("sample_images/liverpool3.jpg")
+            ]
+            for path in sample_paths:
+                if os.path.exists(path):
+                    city_queue.append(path)
+        
+        # Always show City images (placeholders if not found)
+        fixed_width = 2.3*inch
+        fixed_height = 2.3*inch
+        
+        # Always show 3 City images (placeholders if missing)
+        while len(city_queue) < 3:
+            city_queue.append(None)
+        
+        # Display 3 images horizontally
+        img_cells = []
+        for img_path in city_queue[:3]:
+            if img_path is None:
+                # Use placeholder
+                placeholder = create_placeholder_drawing(fixed_width, fixed_height)
+                img_cells.append(placeholder)
+            else:
                 try:
-                    # Load image to get dimensions
-                    img_pil = Image.open(directions_image_path)
-                    img_aspect = img_pil.width / img_pil.height
-                    
-                    # Display directions image - full width
-                    img_width = 7*inch
-                    img_height = img_width / img_aspect
-                    
-                    # Limit height to ensure it fits on page
-                    if img_height > 8*inch:
-                        img_height = 8*inch
-                        img_width = img_height * img_aspect
-                    
-                    directions_img = RLImage(directions_image_path, width=img_width, height=img_height)
-                    story.append(directions_img)
+                    if os.path.exists(img_path):
+                        # Use fixed dimensions to make them all the same size (may crop/distort to fit)
+                        img = self._get_image(img_path, fixed_width, fixed_height)
+                        img_cells.append(img)
+                    else:
+                        # Use placeholder if file doesn't exist
+                        placeholder = create_placeholder_drawing(fixed_width, fixed_height)
+                        img_cells.append(placeholder)
                 except Exception as e:
-                    print(f"Error loading directions image: {e}")
+                    image_errors.append((img_path, e))
                     # Use placeholder on error
-                    placeholder = create_placeholder_drawing(7*inch, 4.5*inch)
-                    story.append(placeholder)
-            else:
-                # Use placeholder if not found
-                    placeholder = create_placeholder_drawing(7*inch, 4.5*inch)
-                    story.append(placeholder)
-            
-            story.append(Spacer(1, STANDARD_IMAGE_SPACING))
-            
-            # About the City and City Images - keep together on same page
-            about_city_content = []
-            
-            # About the City
-            if data.get('about_city'):
-                about_city_content.append(Paragraph("About the City", header_style))
-                about_city_content.append(Paragraph(f"<b>{data.get('city', 'N/A')}</b>", highlight_style))
-                about_city_content.append(Paragraph(data.get('about_city'), body_style))
-                about_city_content.append(Paragraph(f"<b>Population:</b> {data.get('population', 'N/A')}", body_style))
-                about_city_content.append(Spacer(1, STANDARD_CONTENT_SPACING))
-            
-            # City Images Section
-            city_queue = list(city_images)
-            
-            # If not provided, fall back to bundled sample images
-            if not city_queue:
-                sample_paths = [
-                    get_resource_path("sample_images/liverpool1.jpg"),
-                    get_resource_path("sample_images/liverpool2.jpg"),
-                    get_resource_path("sample_images/liverpool3.jpg")
-                ]
-                for path in sample_paths:
-                    if os.path.exists(path):
-                        city_queue.append(path)
-            
-            # Always show City images (placeholders if not found)
-            fixed_width = 2.3*inch
-            fixed_height = 2.3*inch
-            
-            # Always show 3 City images (placeholders if missing)
-            while len(city_queue) < 3:
-                city_queue.append(None)
-            
-            # Display 3 images horizontally
-            img_cells = []
-            for img_path in city_queue[:3]:
-                if img_path is None:
-                    # Use placeholder
                     placeholder = create_placeholder_drawing(fixed_width, fixed_height)
                     img_cells.append(placeholder)
-                else:
-                    try:
-                        if os.path.exists(img_path):
-                            # Use fixed dimensions to make them all the same size (may crop/distort to fit)
-                            img = RLImage(img_path, width=fixed_width, height=fixed_height)
-                            img_cells.append(img)
-                        else:
-                            # Use placeholder if file doesn't exist
-                            placeholder = create_placeholder_drawing(fixed_width, fixed_height)
-                            img_cells.append(placeholder)
-                    except Exception as e:
-                        print(f"Error loading city image {img_path}: {e}")
-                        # Use placeholder on error
-                        placeholder = create_placeholder_drawing(fixed_width, fixed_height)
-                        img_cells.append(placeholder)
-            
-            if len(img_cells) == 3:
-                city_table = Table([img_cells], colWidths=[fixed_width, fixed_width, fixed_width])
-                city_table.setStyle(TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('TOPPADDING', (0, 0), (-1, -1), 5),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-                ]))
-                about_city_content.append(city_table)
-            
-            about_city_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
-            
-            # Wrap in KeepTogether to ensure they stay on same page
-            story.append(KeepTogether(about_city_content))
-            
-            # Build PDF
+        
+        if len(img_cells) == 3:
+            city_table = Table([img_cells], colWidths=[fixed_width, fixed_width, fixed_width],
+                               rowHeights=[table_row_height(CITY_IMAGE_PADDING, fixed_height)])
+            city_table.setStyle(table_styles['city'])
+            about_city_content.append(city_table)
+        
+        about_city_content.append(Spacer(1, STANDARD_IMAGE_SPACING))
+        
+        # Wrap in KeepTogether to ensure they stay on same page
+        story.append(KeepTogether(about_city_content))
+        
+        if image_errors:
+            details = "; ".join(f"{path}: {error}" for path, error in image_errors)
+            print(f"Using placeholders for {len(image_errors)} image(s) that could not be loaded: {details}")
+        
+        # Build PDF, reporting flowable progress back to the UI.
+        # The report has no table of contents or page-count references, so a single
+        # build() pass lays it out; avoid multiBuild, which repeats the whole layout.
+        if progress_callback:
+            doc.setProgressCallBack(progress_callback)
+        try:
             doc.build(
                 story,
                 onFirstPage=self._draw_cover_header,
                 onLaterPages=self._draw_standard_header
             )
-            
-        except Exception as e:
-            print(f"Error generating PDF: {e}")
-            messagebox.showerror("Error", f"Error generating PDF: {str(e)}")
-            
-    def create_cover_page(self, data, accent_gold, primary_blue):
+        finally:
+            self._release_prepared_images(images_by_section)
+    
+    def _release_prepared_images(self, images_by_section):
+        """Delete downscaled copies of images that were not part of the latest report"""
+        for prepared_images in (self._prepared_images, self._recompressed_images):
+            for key in [key for key in prepared_images if key not in self._image_cache]:
+                prepared_path = prepared_images.pop(key)
+                if prepared_path:
+                    try:
+                        os.remove(prepared_path)
+                    except OSError:
+                        pass
+        # Large reports leave many decoded images behind; reclaim them before the next run
+        if sum(len(paths) for paths in images_by_section.values()) > 50:
+            gc.collect()
+            
+    def create_cover_page(self, data, accent_gold, primary_blue, images_by_section):
         """Create the cover page with logo, property address, main image, thumbnails, and footer"""
+        from report_flowables import CoverPageFlowable
         # Always create cover page, even if no images (will use placeholders)
-        images_by_section = {key: list(paths) for key, paths in self.image_sections.items()}
-        return CoverPageFlowable(data, images_by_section, accent_gold, primary_blue, logo_path=self.logo_path)
+        images_by_section = {
+            key: [self._canonical_image_path(path) for path in paths]
+            for key, paths in images_by_section.items()
+        }
+        try:
+            logo_reader = self._logo_reader if self._logo_exists else None
+        except Exception:
+            logo_reader = None  # The flowable then falls back to its default logo height
+        return CoverPageFlowable(data, images_by_section, accent_gold, primary_blue, logo_path=self.logo_path,
+                                 image_source=self._canvas_image_source, logo_reader=logo_reader,
+                                 image_aspect=self._image_aspect)
             
     def create_header(self, data, accent_gold, primary_blue):
         """Create a professional header with branding"""
+        from reportlab.lib import colors
+        from reportlab.graphics.shapes import Drawing, Rect, String
         header_drawing = Drawing(7.5*inch, 1.5*inch)
         
         # Background rectangle
@@ -2176,19 +2226,14 @@ class PDFBuilderApp:
         
     def create_epc_chart(self, data, primary_blue, accent_gold, success_green):
         """Create a visual EPC rating chart with vertical bars"""
+        from reportlab.lib import colors
+        from report_flowables import EPC_BANDS, MUTED_GREY, epc_band_index
+        from reportlab.graphics.shapes import Drawing, Rect, String
         # Create a vertical bar chart - narrower width for middle column
         drawing = Drawing(3.5*inch, 2.5*inch)
         
         # EPC bands with colors (A at top, G at bottom)
-        epc_bands = [
-            ('A', 92, 100, HexColor('#008450')),  # Dark green
-            ('B', 81, 91, HexColor('#22c55e')),   # Green
-            ('C', 69, 80, HexColor('#84cc16')),   # Light green
-            ('D', 55, 68, HexColor('#eab308')),   # Yellow
-            ('E', 39, 54, HexColor('#f59e0b')),   # Orange
-            ('F', 21, 38, HexColor('#ef4444')),   # Red
-            ('G', 1, 20, HexColor('#dc2626'))     # Dark red
-        ]
+        epc_bands = EPC_BANDS
         
         # Create vertical bars for EPC chart (stacked vertically as continuous scale)
         bar_width = 0.5*inch
@@ -2197,30 +2242,35 @@ class PDFBuilderApp:
         start_x = 0.8*inch  # Position for the bar
         start_y = 0.2*inch
         
+        # Loop invariants: every band shares the same columns and half-height offset
+        add = drawing.add
+        half_bar_height = bar_height / 2
+        label_x = start_x + bar_width + 0.15*inch
+        range_x = label_x + 0.35*inch
+        top_band_y = start_y + (len(epc_bands) - 1) * bar_height
+        
         # Draw bars from top (A) to bottom (G) as continuous stacked rectangles
         for i, (grade, min_score, max_score, color) in enumerate(epc_bands):
-            y = start_y + (len(epc_bands) - 1 - i) * bar_height
+            y = top_band_y - i * bar_height
             
             # Bar background - continuous vertical scale
-            drawing.add(Rect(start_x, y, bar_width, bar_height, 
-                           fillColor=color, strokeColor=colors.black, strokeWidth=0.5))
+            add(Rect(start_x, y, bar_width, bar_height, 
+                     fillColor=color, strokeColor=colors.black, strokeWidth=0.5))
             
             # Grade label on the right side of the bar
-            label_x = start_x + bar_width + 0.15*inch
-            label_y = y + bar_height / 2
-            drawing.add(String(label_x, label_y, grade, 
-                             fontName="Helvetica-Bold", fontSize=13, 
-                             fillColor=colors.black, textAnchor="start"))
+            label_y = y + half_bar_height
+            add(String(label_x, label_y, grade, 
+                       fontName="Helvetica-Bold", fontSize=13, 
+                       fillColor=colors.black, textAnchor="start"))
             
             # Score range next to grade
-            range_x = label_x + 0.35*inch
             if min_score == 92:
                 range_text = f"{min_score}+"
             else:
                 range_text = f"{min_score}-{max_score}"
-            drawing.add(String(range_x, label_y, range_text, 
-                             fontName="Helvetica", fontSize=10, 
-                             fillColor=HexColor('#666666'), textAnchor="start"))
+            add(String(range_x, label_y, range_text, 
+                       fontName="Helvetica", fontSize=10, 
+                       fillColor=MUTED_GREY, textAnchor="start"))
         
         # Add current and potential scores
         current_score = int(data.get('current_rating', '72'))
@@ -2228,14 +2278,11 @@ class PDFBuilderApp:
         
         # Find which band the scores fall into and calculate position
         def get_y_position(score):
-            for i, (_, min_score, max_score, _) in enumerate(epc_bands):
-                if min_score <= score <= max_score:
-                    # Calculate position within the band
-                    band_index = len(epc_bands) - 1 - i
-                    y_base = start_y + band_index * bar_height
-                    # Position in middle of band
-                    return y_base + bar_height / 2
-            return start_y + len(epc_bands) * bar_height / 2
+            band_index = epc_band_index(score)
+            if band_index is None:
+                return start_y + len(epc_bands) * bar_height / 2
+            # Position in middle of band
+            return start_y + band_index * bar_height + half_bar_height
         
         current_y = get_y_position(current_score)
         potential_y = get_y_position(potential_score)
@@ -2261,13 +2308,13 @@ class PDFBuilderApp:
         drawing.add(String(start_x + bar_width/2, start_y + total_bar_height + 0.18*inch, 
                          "Very energy efficient - lower running costs", 
                          fontName="Helvetica", fontSize=8, 
-                         fillColor=HexColor('#666666'), textAnchor="middle"))
+                         fillColor=MUTED_GREY, textAnchor="middle"))
         
         # Add text below chart
         drawing.add(String(start_x + bar_width/2, start_y - 0.18*inch, 
                          "Not energy efficient - higher running costs", 
                          fontName="Helvetica", fontSize=8, 
-                         fillColor=HexColor('#666666'), textAnchor="middle"))
+                         fillColor=MUTED_GREY, textAnchor="middle"))
         
         return drawing
 
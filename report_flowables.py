@@ -0,0 +1,357 @@
+"""Flowables, drawings and layout helpers for the property report.
+
+Importing this module turns off ReportLab's per-attribute validation of graphics shapes
+(rl_config.shapeChecking) for the rest of the process. ReportLab fixes that choice when
+reportlab.graphics.shapes is first imported, so it cannot be scoped to a single build;
+the global setting itself is restored straight after the import so other ReportLab code
+keeps its checks. Set PDF_BUILDER_DEBUG=1 to keep shape validation on.
+"""
+from PIL import Image
+import os
+import datetime
+from bisect import bisect_right
+from functools import lru_cache
+from reportlab import rl_config
+
+# Skip validation on the EPC chart and placeholder shapes; see the module docstring
+_shape_checking = rl_config.shapeChecking
+if not os.environ.get('PDF_BUILDER_DEBUG'):
+    rl_config.shapeChecking = 0
+from reportlab.graphics.shapes import Drawing, Rect
+rl_config.shapeChecking = _shape_checking
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab.lib.colors import HexColor
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus.flowables import Flowable
+
+# Report palette, parsed once when the report modules are first imported
+PRIMARY_BLUE = HexColor('#1e3a8a')   # Dark blue
+ACCENT_GOLD = HexColor('#f59e0b')    # Gold
+SUCCESS_GREEN = HexColor('#10b981')  # Green
+DARK_GREY = HexColor('#374151')
+TAGLINE_GREY = HexColor('#334155')
+MUTED_GREY = HexColor('#666666')
+RULE_GREY = HexColor('#E0E0E0')
+PLACEHOLDER_GREY = HexColor('#CCCCCC')
+
+# Cover page layout, in points
+COVER_ADDRESS_LINE_SPACING = 0.35*inch
+COVER_ADDRESS_TO_IMAGE_GAP = 0.1*inch
+COVER_MAIN_IMAGE_HEIGHT = 4.5*inch
+COVER_THUMBNAIL_DROP = 2*inch  # Main image bottom to thumbnail bottom
+COVER_THUMBNAIL_HEIGHT = 1.5*inch
+COVER_THUMBNAIL_GAP = 0.2*inch
+COVER_FOOTER_HEIGHT = 0.4*inch
+
+# EPC bands as (grade, min score, max score, colour), A at the top
+EPC_BANDS = (
+    ('A', 92, 100, HexColor('#008450')),  # Dark green
+    ('B', 81, 91, HexColor('#22c55e')),   # Green
+    ('C', 69, 80, HexColor('#84cc16')),   # Light green
+    ('D', 55, 68, HexColor('#eab308')),   # Yellow
+    ('E', 39, 54, HexColor('#f59e0b')),   # Orange
+    ('F', 21, 38, HexColor('#ef4444')),   # Red
+    ('G', 1, 20, HexColor('#dc2626')),    # Dark red
+)
+
+# Lowest score of each band from G up to A, for bisecting a score into its band
+_EPC_CUTOFFS = tuple(min_score for _, min_score, _, _ in reversed(EPC_BANDS))
+_EPC_MAX_SCORE = EPC_BANDS[0][2]
+
+def epc_band_index(score):
+    """Index of the band containing score counted from G (0) up to A, or None if out of range"""
+    if not _EPC_CUTOFFS[0] <= score <= _EPC_MAX_SCORE:
+        return None
+    return bisect_right(_EPC_CUTOFFS, score) - 1
+
+@lru_cache(maxsize=1)
+def format_date_with_ordinal(date_obj):
+    """Format date with ordinal suffix (1st, 2nd, 3rd, 4th, etc.)"""
+    day = date_obj.day
+    if 10 <= day % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+    return date_obj.strftime(f"{day}{suffix} %B %Y")
+
+@lru_cache(maxsize=2048)
+def text_width(text, font_name, font_size):
+    """Width of text in points, memoized since addresses and footers repeat across reports"""
+    return stringWidth(text, font_name, font_size)
+
+def wrap_words(text, font_name, font_size, max_width):
+    """Greedily split text into lines no wider than max_width, measuring each word once"""
+    space_width = text_width(" ", font_name, font_size)
+    lines = []
+    current_words = []
+    current_width = 0
+    for word in text.split():
+        word_width = text_width(word, font_name, font_size)
+        if not current_words:
+            current_words, current_width = [word], word_width
+        elif current_width + space_width + word_width <= max_width:
+            current_words.append(word)
+            current_width += space_width + word_width
+        else:
+            lines.append(" ".join(current_words))
+            current_words, current_width = [word], word_width
+    if current_words:
+        lines.append(" ".join(current_words))
+    return lines
+
+def image_aspect_ratio(path):
+    """Width/height ratio of an image file, read from its header without keeping it open"""
+    with Image.open(path) as img:
+        width, height = img.size
+    return width / height
+
+def create_placeholder_drawing(width, height):
+    """Create a gray placeholder Drawing for use in PDF"""
+    placeholder = Drawing(width, height)
+    placeholder.add(Rect(0, 0, width, height, fillColor=PLACEHOLDER_GREY, strokeColor=PLACEHOLDER_GREY))
+    return placeholder
+
+class FileImage(Flowable):
+    """Fixed-size image drawn straight from its file.
+    
+    ReportLab's Image flowable decodes non-JPEG files into a fresh ImageReader on every
+    draw and names the XObject after the pixels. Drawing by file name keys the XObject
+    on the path instead, so each file is read once per PDF however often it appears,
+    and the cover page's drawImage calls share the same XObject.
+    """
+    def __init__(self, path, width, height, hAlign='CENTER', aspect=None):
+        Flowable.__init__(self)
+        # Read the header now so an unreadable file raises here, where callers swap in a
+        # placeholder, rather than failing the whole build when the page is drawn.
+        # Callers that already measured the image pass its aspect and skip the read.
+        if aspect is None:
+            image_aspect_ratio(path)
+        self.path = path
+        self.width = width
+        self.height = height
+        self.hAlign = hAlign
+    
+    def draw(self):
+        self.canv.drawImage(self.path, 0, 0, width=self.width, height=self.height, mask='auto')
+
+class CoverPageFlowable(Flowable):
+    """Custom flowable for cover page with absolute positioning"""
+    def __init__(self, data, images_by_section, accent_gold, primary_blue, logo_path=None, image_source=None,
+                 logo_reader=None, image_aspect=None):
+        Flowable.__init__(self)
+        self.data = data
+        self.images_by_section = images_by_section
+        self.accent_gold = accent_gold
+        self.primary_blue = primary_blue
+        self.logo_path = logo_path
+        # Share the caller's already-open logo instead of reading the file again
+        self.logo_reader = logo_reader
+        # Maps an image path to the path or ImageReader passed to drawImage
+        self.image_source = image_source or (lambda path: path)
+        # Returns an image's width/height ratio; the caller's version remembers it per PDF
+        self.image_aspect = image_aspect or image_aspect_ratio
+        self.main_img_path, self.thumbnail_images = self._select_cover_images(images_by_section)
+        # Footer text and its width depend only on today's date
+        self.footer_text = f"Report created on {format_date_with_ordinal(datetime.date.today())}"
+        self.footer_text_width = text_width(self.footer_text, "Helvetica", 11)
+        # Check the chosen files once here rather than on every draw
+        self.existing_paths = {
+            path for path in (self.main_img_path, *self.thumbnail_images)
+            if path and os.path.exists(path)
+        }
+        
+        # Calculate margins to match document margins exactly
+        # Use same calculation as in generate_pdf for consistency
+        left_margin = 0.75*inch
+        right_margin = 0.75*inch
+        bottom_margin = 0.75*inch
+        HEADER_TOP_OFFSET = 0.45 * inch
+        
+        # Calculate header height using same logic as generate_pdf
+        TAGLINE_SPACING_POINTS = 12
+        TAGLINE_FONT_SIZE = 9
+        TAGLINE_TEXT_MARGIN = 2
+        TAGLINE_TOTAL_HEIGHT = (TAGLINE_SPACING_POINTS + TAGLINE_FONT_SIZE + TAGLINE_TEXT_MARGIN) / 72.0 * inch
+        
+        # Get actual logo height (same calculation as generate_pdf)
+        logo_width = 1.4 * inch
+        LOGO_ACTUAL_HEIGHT = 0.6*inch  # Default fallback
+        if self.logo_path and os.path.exists(self.logo_path):
+            try:
+                logo_reader = self.logo_reader
+                if logo_reader is None:
+                    from reportlab.lib.utils import ImageReader
+                    logo_reader = ImageReader(self.logo_path)
+                img_width, img_height = logo_reader.getSize()
+                if img_width and img_height:
+                    LOGO_ACTUAL_HEIGHT = logo_width * (img_height / img_width)
+            except Exception:
+                pass
+        
+        HEADER_TO_CONTENT_SPACING = 0  # No spacing - content starts immediately
+        top_margin = HEADER_TOP_OFFSET + LOGO_ACTUAL_HEIGHT + TAGLINE_TOTAL_HEIGHT + HEADER_TO_CONTENT_SPACING
+        
+        # Flowable dimensions match the actual frame size
+        # Subtract a safety margin to ensure it fits within the frame
+        # (reportlab frames may have slight internal padding or rounding differences)
+        # 12 points = 0.167 inches, use slightly more for safety
+        safety_margin = 0.2 * inch  # Safety margin to ensure fit (covers ~14.4 points)
+        self.width = A4[0] - left_margin - right_margin - safety_margin
+        self.height = A4[1] - top_margin - bottom_margin - safety_margin
+        
+    @staticmethod
+    def _select_cover_images(images_by_section):
+        """Pick the main cover photo and up to three thumbnails from the image sections"""
+        cover_images = images_by_section.get('cover', [])
+        gallery_images = images_by_section.get('property', [])
+        fallback_sections = ['floor_plans', 'directions', 'city']
+        
+        main_img_path = None
+        candidate_groups = [cover_images, gallery_images] + [
+            images_by_section.get(section_key, []) for section_key in fallback_sections
+        ]
+        for group in candidate_groups:
+            if group:
+                main_img_path = group[0]
+                break
+        
+        # Thumbnails exclude the main image
+        thumbnail_candidates = []
+        if len(cover_images) > 1:
+            thumbnail_candidates.extend(cover_images[1:])
+        thumbnail_candidates.extend(img for img in gallery_images if img != main_img_path)
+        return main_img_path, thumbnail_candidates[:3]
+    
+    def draw(self):
+        """Draw the cover page - note: reportlab uses bottom-left as origin"""
+        canvas = self.canv
+        # Use the declared width/height for content
+        width = self.width
+        height = self.height
+        
+        # Logo and tagline are drawn in _draw_cover_header callback
+        # The flowable starts at topMargin from page top, which equals the header height
+        # So content should start at the very top of the flowable (y = height)
+        
+        # Property Address (large, bold) - handle text wrapping
+        # Position address at top of flowable - no spacing after tagline
+        address = f"{self.data.get('address', '')}, {self.data.get('postal_code', '')}"
+        canvas.setFont("Helvetica-Bold", 24)
+        canvas.setFillColor(colors.black)
+        # Split address if too long (simple approach)
+        address_lines = wrap_words(address, "Helvetica-Bold", 24, width)
+        
+        # Position address to match "Investment Opportunity" positioning
+        # Paragraph elements position the first line's baseline accounting for font metrics.
+        # For 24pt Helvetica-Bold, reportlab typically positions baseline ~12-14 points below top.
+        # This accounts for the font's natural positioning in a text flow.
+        paragraph_baseline_offset = 14 / 72.0 * inch  # ~14 points offset to match Paragraph positioning
+        address_y = height - paragraph_baseline_offset  # Position to match Paragraph baseline
+        for i, line in enumerate(address_lines):
+            canvas.drawString(0, address_y - (i * COVER_ADDRESS_LINE_SPACING), line)
+        
+        # Calculate where the address text area ends
+        # Last line baseline - font height (24pt = ~0.33 inch)
+        last_line_baseline = address_y - (len(address_lines) - 1) * COVER_ADDRESS_LINE_SPACING
+        font_height = 24 / 72.0 * inch  # Convert 24pt to inches
+        address_bottom = last_line_baseline - font_height
+        
+        # Add spacing between address and main image - reduced to push images up
+        spacing_between_text_and_images = COVER_ADDRESS_TO_IMAGE_GAP
+        
+        # Main image - select from configured sections
+        # Position main image below the address with spacing
+        main_image_height = COVER_MAIN_IMAGE_HEIGHT
+        main_image_bottom = address_bottom - spacing_between_text_and_images - main_image_height
+        main_image_width = width
+        
+        main_img_path = self.main_img_path
+        
+        # Grey boxes for missing images, drawn together after the photos
+        placeholder_rects = []
+        
+        # Always draw main image (use placeholder if no image available)
+        try:
+            if main_img_path in self.existing_paths:
+                # Calculate dimensions to fit while maintaining aspect ratio
+                img_ratio = self.image_aspect(main_img_path)
+                target_ratio = main_image_width / main_image_height
+                
+                if img_ratio > target_ratio:
+                    # Image is wider, fit to width
+                    draw_width = main_image_width
+                    draw_height = main_image_width / img_ratio
+                else:
+                    # Image is taller, fit to height
+                    draw_height = main_image_height
+                    draw_width = main_image_height * img_ratio
+                
+                # Center the image
+                x_offset = (main_image_width - draw_width) / 2
+                # mask='auto' matches the Image flowables so a photo shown again later reuses this XObject
+                canvas.drawImage(self.image_source(main_img_path), x_offset, main_image_bottom,
+                               width=draw_width, height=draw_height, mask='auto', preserveAspectRatio=True)
+            else:
+                # Draw gray placeholder rectangle
+                placeholder_rects.append((0, main_image_bottom, main_image_width, main_image_height))
+        except Exception as e:
+            print(f"Error adding main image: {e}")
+            # Draw gray placeholder rectangle on error
+            placeholder_rects.append((0, main_image_bottom, main_image_width, main_image_height))
+        
+        # Three thumbnail images below main image (exclude the main image)
+        thumbnail_bottom = main_image_bottom - COVER_THUMBNAIL_DROP
+        thumbnail_height = COVER_THUMBNAIL_HEIGHT
+        thumbnail_width = (width - 2 * COVER_THUMBNAIL_GAP) / 3  # 3 thumbnails with spacing
+        thumbnail_step = thumbnail_width + COVER_THUMBNAIL_GAP
+        
+        thumbnail_images = self.thumbnail_images
+        
+        # Always show 3 thumbnails (use placeholders if not enough images)
+        for i in range(3):
+            thumb_x = i * thumbnail_step
+            thumb_y_position = thumbnail_bottom
+            
+            if i < len(thumbnail_images):
+                # Use actual image
+                try:
+                    thumb_img_path = thumbnail_images[i]
+                    if thumb_img_path in self.existing_paths:
+                        canvas.drawImage(self.image_source(thumb_img_path), thumb_x, thumb_y_position,
+                                       width=thumbnail_width, height=thumbnail_height, mask='auto',
+                                       preserveAspectRatio=False)
+                    else:
+                        # Draw gray placeholder
+                        placeholder_rects.append((thumb_x, thumb_y_position, thumbnail_width, thumbnail_height))
+                except Exception as e:
+                    print(f"Error adding thumbnail {i+1}: {e}")
+                    # Draw gray placeholder on error
+                    placeholder_rects.append((thumb_x, thumb_y_position, thumbnail_width, thumbnail_height))
+            else:
+                # Draw gray placeholder for missing thumbnails
+                placeholder_rects.append((thumb_x, thumb_y_position, thumbnail_width, thumbnail_height))
+        
+        # One fill colour change covers every placeholder; they never overlap the photos
+        if placeholder_rects:
+            canvas.setFillColor(PLACEHOLDER_GREY)
+            for x, y, rect_width, rect_height in placeholder_rects:
+                canvas.rect(x, y, rect_width, rect_height, fill=1, stroke=0)
+
+        
+        # Footer bar with gold background - fixed at the bottom of the page
+        footer_height = COVER_FOOTER_HEIGHT
+        # Always position footer at the bottom of the page (accounting for margins)
+        footer_y = 0  # Bottom of the available canvas area
+        
+        canvas.setFillColor(self.accent_gold)
+        canvas.rect(0, footer_y, width, footer_height, fill=1, stroke=0)
+        
+        # Footer text (centered, white)
+        canvas.setFont("Helvetica", 11)
+        canvas.setFillColor(colors.white)
+        # Center text vertically in footer
+        text_y = footer_y + (footer_height / 2) - 0.1*inch  # Adjust for font baseline
+        canvas.drawString((width - self.footer_text_width) / 2, text_y, self.footer_text)